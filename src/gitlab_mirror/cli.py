@@ -3,26 +3,58 @@
 import json
 import os
 import shutil
+import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional
 
 import click
-import git
-from rich.console import Console
+from rich.cells import cell_len
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
-from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+from rich.style import Style
 from rich.table import Table
 from rich.text import Text
 
 from . import __version__
-from .config import Config, debug_config, find_config_file, find_env_file, load_config
-from .logger import logger, setup_logger
-from .models import ProjectStatus, SyncSummary
-from .sync import ProjectSynchronizer
+from .logger import flush_logger, setup_logger
+from .models import ProjectStatus, SyncResult, SyncSummary
 
-console = Console()
+# GitPython, python-gitlab, rich.progress et la configuration (pydantic) sont
+# importés à la demande dans les commandes qui en ont besoin : `lgm --help` ou
+# `lgm --version` n'en paient pas le coût d'import.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from .config import Config
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None  # type: ignore[assignment]
+
+# Pas de coloration syntaxique automatique quand la sortie est redirigée
+console = Console(highlight=sys.stdout.isatty())
+
+
+def print_json(output: dict[str, Any]) -> None:
+    """Écrit un document JSON indenté sur la sortie standard.
+
+    Utilise orjson s'il est installé (extra "performance"), sinon json en
+    flux : le document n'est jamais matérialisé en une seule chaîne. Les deux
+    chemins écrivent l'UTF-8 tel quel (ensure_ascii=False), sans échappement
+    des accents.
+    """
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_INDENT_2, default=str))
+        sys.stdout.buffer.write(b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(output, sys.stdout, indent=2, default=str, ensure_ascii=False)
+        sys.stdout.write("\n")
 
 
 # ============================================================================
@@ -63,8 +95,10 @@ def cli(ctx: click.Context) -> None:
         click.echo(ctx.get_help())
 
 
-def create_progress_bar() -> Progress:
+def create_progress_bar() -> "Progress":
     """Crée une barre de progression Rich."""
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[bold blue]{task.description}"),
@@ -84,7 +118,7 @@ def print_banner() -> None:
     console.print(Panel(banner, subtitle="Synchronisation GitLab → Filesystem"))
 
 
-def print_config(config: Config) -> None:
+def print_config(config: "Config") -> None:
     """Affiche la configuration utilisée."""
     table = Table(title="Configuration", show_header=False, box=None)
     table.add_column("Paramètre", style="cyan")
@@ -100,7 +134,148 @@ def print_config(config: Config) -> None:
     console.print()
 
 
-def print_summary(summary: SyncSummary, config: Config, elapsed: float = 0) -> None:
+# Styles pré-construits : les cellules du résumé sont des Text déjà stylés,
+# sans balisage à ré-analyser à chaque affichage
+_GREEN = Style(color="green")
+_BLUE = Style(color="blue")
+_YELLOW = Style(color="yellow")
+_RED = Style(color="red")
+_CYAN = Style(color="cyan")
+_DIM = Style(dim=True)
+
+# Lignes de comptage du résumé : (libellé, attribut de SyncSummary, style)
+SUMMARY_ROWS = (
+    ("✓ Clonés", "cloned", _GREEN),
+    ("↑ Mis à jour", "updated", _BLUE),
+    ("= Déjà à jour", "already_up_to_date", _DIM),
+    ("⊘ Ignorés", "ignored", _YELLOW),
+    ("⊖ Exclus", "excluded", _DIM),
+    ("✗ Erreurs", "errors", _RED),
+)
+
+# Nombre de lignes au-delà duquel les détails sont rendus sans Table
+BULK_TABLE_THRESHOLD = 500
+
+
+def _format_elapsed(elapsed: float) -> str:
+    """Formate une durée en secondes (ex: '12.3s', '2m 5s')."""
+    if elapsed < 60:
+        return f"{elapsed:.1f}s"
+    mins = int(elapsed // 60)
+    secs = elapsed % 60
+    return f"{mins}m {secs:.0f}s"
+
+
+def _detail_table(
+    title: str,
+    columns: tuple[tuple[str, str], ...],
+    rows: list[tuple[str, ...]],
+) -> RenderableType:
+    """Construit un tableau de détail du résumé.
+
+    Au-delà de BULK_TABLE_THRESHOLD lignes, la mise en page de Table (validation
+    et mesure de chaque cellule) coûte plus cher que l'affichage lui-même : on
+    rend alors un simple bloc de texte pré-assemblé, aligné sur la largeur
+    maximale de chaque colonne (mesurée une fois par cellule).
+
+    Args:
+        title: Titre du tableau
+        columns: Colonnes (en-tête, style)
+        rows: Lignes à afficher
+
+    Returns:
+        Tableau Rich, ou groupe de texte brut pour les gros volumes
+    """
+    if len(rows) > BULK_TABLE_THRESHOLD:
+        headers = tuple(header for header, _style in columns)
+        measured = [(row, [cell_len(cell) for cell in row]) for row in (headers, *rows)]
+        widths = [max(lengths[i] for _row, lengths in measured) for i in range(len(headers))]
+        lines = [
+            "  ".join(
+                cell + " " * (widths[i] - lengths[i]) for i, cell in enumerate(row)
+            ).rstrip()
+            for row, lengths in measured
+        ]
+        return Group(Text(title, style="bold"), Text("\n".join(lines)))
+
+    table = Table(title=title, show_header=True)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _partition_results(summary: SyncSummary) -> dict[ProjectStatus, list[SyncResult]]:
+    """Répartit en une seule passe les résultats à détailler par statut."""
+    by_status: dict[ProjectStatus, list[SyncResult]] = {
+        ProjectStatus.ERROR: [],
+        ProjectStatus.EXCLUDED: [],
+        ProjectStatus.IGNORED: [],
+    }
+    # Cas courant (aucun projet à détailler) : les compteurs suffisent
+    if not (summary.errors or summary.excluded or summary.ignored):
+        return by_status
+    for result in summary.results:
+        bucket = by_status.get(result.status)
+        if bucket is not None:
+            bucket.append(result)
+    return by_status
+
+
+def _print_summary_plain(
+    summary: SyncSummary,
+    config: "Config",
+    elapsed: float,
+    by_status: dict[ProjectStatus, list[SyncResult]],
+) -> None:
+    """Affiche le résumé en texte brut (sortie redirigée, CI).
+
+    Évite la mise en page Rich quand personne ne lit un terminal.
+    """
+    lines = ["", "=" * 70, ""]
+    lines.append(f"Groupes traités\t{summary.total_groups}")
+    lines.append(f"Projets trouvés\t{summary.total_projects}")
+    for label, attr, _style in SUMMARY_ROWS:
+        lines.append(f"{label}\t{getattr(summary, attr)}")
+    if summary.total_projects > 0:
+        lines.append(f"Taux de réussite\t{summary.success_rate:.1f}%")
+    if elapsed > 0:
+        lines.append(f"⏱ Durée\t{_format_elapsed(elapsed)}")
+
+    error_results = [r for r in by_status[ProjectStatus.ERROR] if r.error_message]
+    if error_results:
+        lines.extend(["", "❌ Erreurs détaillées"])
+        lines.extend(
+            f"{r.project.path_with_namespace}\t{(r.error_message or '')[:80]}"
+            for r in error_results
+        )
+    if by_status[ProjectStatus.EXCLUDED] and config.verbose:
+        lines.extend(["", "⊖ Projets exclus par pattern"])
+        lines.extend(
+            f"{r.project.path_with_namespace}\t{r.error_message or ''}"
+            for r in by_status[ProjectStatus.EXCLUDED]
+        )
+    if by_status[ProjectStatus.IGNORED] and config.verbose:
+        lines.extend(["", "⊘ Projets ignorés (conflits)"])
+        lines.extend(
+            f"{r.project.path_with_namespace}\t"
+            f"{r.error_message or 'Conflit avec dossier existant'}"
+            for r in by_status[ProjectStatus.IGNORED]
+        )
+
+    lines.append("")
+    if config.dry_run:
+        lines.append("Mode DRY-RUN: Aucune modification n'a été effectuée")
+    else:
+        lines.append(f"✓ Synchronisation terminée ! Dossier: {config.root_dir}")
+    lines.append("")
+
+    console.file.write("\n".join(lines) + "\n")
+    console.file.flush()
+
+
+def print_summary(summary: SyncSummary, config: "Config", elapsed: float = 0) -> None:
     """Affiche le résumé de la synchronisation.
 
     Args:
@@ -108,9 +283,14 @@ def print_summary(summary: SyncSummary, config: Config, elapsed: float = 0) -> N
         config: Configuration utilisée
         elapsed: Temps écoulé en secondes
     """
-    console.print()
-    console.print("=" * 70)
-    console.print()
+    by_status = _partition_results(summary)
+
+    if not console.is_terminal:
+        _print_summary_plain(summary, config, elapsed, by_status)
+        return
+
+    # Tout est accumulé puis rendu en une seule fois à la fin
+    renderables: list[RenderableType] = ["", "=" * 70, ""]
 
     # Tableau de résumé
     table = Table(title="📊 Résumé de la synchronisation", show_header=True)
@@ -122,106 +302,80 @@ def print_summary(summary: SyncSummary, config: Config, elapsed: float = 0) -> N
     table.add_row("", "")
 
     # Colorier selon le statut
-    table.add_row(
-        "✓ Clonés",
-        f"[green]{summary.cloned}[/green]" if summary.cloned > 0 else "0",
-    )
-    table.add_row(
-        "↑ Mis à jour",
-        f"[blue]{summary.updated}[/blue]" if summary.updated > 0 else "0",
-    )
-    table.add_row(
-        "= Déjà à jour",
-        f"[dim]{summary.already_up_to_date}[/dim]" if summary.already_up_to_date > 0 else "0",
-    )
-    table.add_row(
-        "⊘ Ignorés",
-        f"[yellow]{summary.ignored}[/yellow]" if summary.ignored > 0 else "0",
-    )
-    table.add_row(
-        "⊖ Exclus",
-        f"[dim]{summary.excluded}[/dim]" if summary.excluded > 0 else "0",
-    )
-    table.add_row(
-        "✗ Erreurs",
-        f"[red]{summary.errors}[/red]" if summary.errors > 0 else "0",
-    )
+    for label, attr, style in SUMMARY_ROWS:
+        value = getattr(summary, attr)
+        table.add_row(label, Text(str(value), style=style) if value > 0 else "0")
 
     if summary.total_projects > 0:
         table.add_row("", "")
         success_rate = summary.success_rate
-        color = "green" if success_rate >= 90 else "yellow" if success_rate >= 70 else "red"
-        table.add_row("Taux de réussite", f"[{color}]{success_rate:.1f}%[/{color}]")
+        rate_style = _GREEN if success_rate >= 90 else _YELLOW if success_rate >= 70 else _RED
+        table.add_row("Taux de réussite", Text(f"{success_rate:.1f}%", style=rate_style))
 
     # Afficher le temps
     if elapsed > 0:
         table.add_row("", "")
-        if elapsed < 60:
-            time_str = f"{elapsed:.1f}s"
-        else:
-            mins = int(elapsed // 60)
-            secs = elapsed % 60
-            time_str = f"{mins}m {secs:.0f}s"
-        table.add_row("⏱ Durée", f"[cyan]{time_str}[/cyan]")
+        table.add_row("⏱ Durée", Text(_format_elapsed(elapsed), style=_CYAN))
 
-    console.print(table)
+    renderables.append(table)
 
     # Afficher les erreurs si présentes
-    if summary.errors > 0:
-        console.print()
-        error_table = Table(title="❌ Erreurs détaillées", show_header=True)
-        error_table.add_column("Projet", style="cyan")
-        error_table.add_column("Erreur", style="red")
-
-        for result in summary.results:
-            if result.status == ProjectStatus.ERROR and result.error_message:
-                error_table.add_row(
-                    result.project.path_with_namespace,
-                    result.error_message[:80],
-                )
-
-        console.print(error_table)
+    error_results = [r for r in by_status[ProjectStatus.ERROR] if r.error_message]
+    if error_results:
+        renderables.append("")
+        renderables.append(
+            _detail_table(
+                "❌ Erreurs détaillées",
+                (("Projet", "cyan"), ("Erreur", "red")),
+                [
+                    (r.project.path_with_namespace, (r.error_message or "")[:80])
+                    for r in error_results
+                ],
+            )
+        )
 
     # Afficher les projets exclus par pattern
-    if summary.excluded > 0 and config.verbose:
-        console.print()
-        excluded_table = Table(title="⊖ Projets exclus par pattern", show_header=True)
-        excluded_table.add_column("Projet", style="cyan")
-        excluded_table.add_column("Pattern", style="dim")
-
-        for result in summary.results:
-            if result.status == ProjectStatus.EXCLUDED:
-                excluded_table.add_row(
-                    result.project.path_with_namespace,
-                    result.error_message or "",
-                )
-
-        console.print(excluded_table)
+    excluded_results = by_status[ProjectStatus.EXCLUDED]
+    if excluded_results and config.verbose:
+        renderables.append("")
+        renderables.append(
+            _detail_table(
+                "⊖ Projets exclus par pattern",
+                (("Projet", "cyan"), ("Pattern", "dim")),
+                [
+                    (r.project.path_with_namespace, r.error_message or "")
+                    for r in excluded_results
+                ],
+            )
+        )
 
     # Afficher les projets ignorés (conflits) si présents
-    if summary.ignored > 0 and config.verbose:
-        console.print()
-        ignored_table = Table(title="⊘ Projets ignorés (conflits)", show_header=True)
-        ignored_table.add_column("Projet", style="cyan")
-        ignored_table.add_column("Raison", style="yellow")
-
-        for result in summary.results:
-            if result.status == ProjectStatus.IGNORED:
-                ignored_table.add_row(
-                    result.project.path_with_namespace,
-                    result.error_message or "Conflit avec dossier existant",
-                )
-
-        console.print(ignored_table)
+    ignored_results = by_status[ProjectStatus.IGNORED]
+    if ignored_results and config.verbose:
+        renderables.append("")
+        renderables.append(
+            _detail_table(
+                "⊘ Projets ignorés (conflits)",
+                (("Projet", "cyan"), ("Raison", "yellow")),
+                [
+                    (
+                        r.project.path_with_namespace,
+                        r.error_message or "Conflit avec dossier existant",
+                    )
+                    for r in ignored_results
+                ],
+            )
+        )
 
-    console.print()
+    renderables.append("")
 
     if config.dry_run:
-        console.print("[yellow]Mode DRY-RUN: Aucune modification n'a été effectuée[/yellow]")
+        renderables.append("[yellow]Mode DRY-RUN: Aucune modification n'a été effectuée[/yellow]")
     else:
-        console.print(f"[green]✓ Synchronisation terminée ![/green] " f"Dossier: {config.root_dir}")
+        renderables.append(f"[green]✓ Synchronisation terminée ![/green] Dossier: {config.root_dir}")
 
-    console.print()
+    renderables.append("")
+    console.print(Group(*renderables))
 
 
 @cli.command("sync")
@@ -283,7 +437,7 @@ def print_summary(summary: SyncSummary, config: Config, elapsed: float = 0) -> N
     "-j",
     type=int,
     default=None,
-    help="Nombre de threads parallèles (défaut: depuis config.toml ou 4)",
+    help="Nombre de threads parallèles (défaut: depuis config.toml ou 4 par CPU, max 32)",
 )
 @click.option(
     "--exclude",
@@ -316,6 +470,24 @@ def print_summary(summary: SyncSummary, config: Config, elapsed: float = 0) -> N
     is_flag=True,
     help="Partial clone: télécharge blobs à la demande (pour très gros repos).",
 )
+@click.option(
+    "--partial-filter",
+    "partial_clone_filter",
+    type=click.Choice(["blob:none", "tree:0", "blob:limit=1m"]),
+    default=None,
+    help="Filtre de partial clone (tree:0 = historique seul, objets à la demande).",
+)
+@click.option(
+    "--no-checkout",
+    is_flag=True,
+    help="Cloner sans checkout (les objets sont récupérés au premier checkout).",
+)
+@click.option(
+    "--bare",
+    "bare_clone",
+    is_flag=True,
+    help="Cloner en dépôt bare (miroir sans copie de travail, moitié moins d'espace).",
+)
 @click.option(
     "--prune",
     is_flag=True,
@@ -378,6 +550,9 @@ def sync_cmd(
     depth: int,
     single_branch: bool,
     filter_blobs: bool,
+    partial_clone_filter: Optional[str],
+    no_checkout: bool,
+    bare_clone: bool,
     prune: bool,
     archived: bool,
     since: int,
@@ -397,6 +572,8 @@ def sync_cmd(
       lgm sync -g groupe -e "*/test-*" --json
 
     """
+    from .config import load_config
+
     try:
         # Afficher la bannière (sauf en mode JSON)
         if not json_output:
@@ -407,6 +584,7 @@ def sync_cmd(
             verbose=verbose and not json_output,
             debug=debug and not json_output,
             log_file=log_file if log_file else None,
+            queued=True,
         )
 
         # Charger la configuration
@@ -428,6 +606,9 @@ def sync_cmd(
                 clone_depth=depth,
                 single_branch=single_branch,
                 filter_blobs=filter_blobs,
+                partial_clone_filter=partial_clone_filter,
+                no_checkout=no_checkout,
+                bare_clone=bare_clone,
                 json_output=json_output,
                 prune=prune,
                 include_archived=archived,
@@ -445,6 +626,8 @@ def sync_cmd(
             print_config(config)
 
         # Créer le synchroniseur
+        from .sync import ProjectSynchronizer
+
         synchronizer = ProjectSynchronizer(config)
 
         # Lancer la synchronisation
@@ -454,8 +637,11 @@ def sync_cmd(
         # Mesurer le temps
         start_time = time.time()
 
-        # Synchroniser (les logs sont gérés par le logger)
-        summary = synchronizer.sync_groups(list(groups))
+        # Synchroniser (les logs sont gérés par le logger, écrits par son thread)
+        try:
+            summary = synchronizer.sync_groups(list(groups))
+        finally:
+            flush_logger()
 
         # Calculer le temps écoulé
         elapsed = time.time() - start_time
@@ -475,7 +661,7 @@ def sync_cmd(
                 "elapsed_seconds": round(elapsed, 2),
                 "root_dir": str(config.root_dir),
             }
-            print(json.dumps(output, indent=2))
+            print_json(output)
         else:
             print_summary(summary, config, elapsed)
 
@@ -493,6 +679,112 @@ def sync_cmd(
         sys.exit(1)
 
 
+class _LocalRepoInfo(NamedTuple):
+    """État d'un dépôt local relevé par la commande status."""
+
+    branch: str = "?"
+    dirty: bool = False
+    error: bool = False
+
+
+_INVALID_REPO = _LocalRepoInfo(error=True)
+
+
+def _run_git_readonly(
+    repo_path: Path, args: list[str], timeout: int
+) -> Optional[subprocess.CompletedProcess[str]]:
+    """Lance une commande git en lecture seule dans un dépôt local.
+
+    Args:
+        repo_path: Chemin du dépôt
+        args: Arguments de la commande git
+        timeout: Timeout de la commande git (secondes)
+
+    Returns:
+        Résultat du processus, ou None si git n'a pas pu être lancé
+    """
+    try:
+        return subprocess.run(
+            ["git", "-C", str(repo_path), *args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+            env={
+                **os.environ,
+                # Lecture seule : ne pas rafraîchir l'index en arrière-plan
+                "GIT_OPTIONAL_LOCKS": "0",
+                # Un .git invalide ne doit pas remonter vers un dépôt parent
+                "GIT_CEILING_DIRECTORIES": str(repo_path.parent),
+            },
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def _inspect_bare_repo(rel_path: str, repo_path: Path, timeout: int) -> tuple[str, _LocalRepoInfo]:
+    """Inspecte un dépôt bare (`git status` y échoue, faute de copie de travail).
+
+    Args:
+        rel_path: Chemin relatif du dépôt
+        repo_path: Chemin du dépôt
+        timeout: Timeout des commandes git (secondes)
+
+    Returns:
+        Tuple (chemin relatif, informations du dépôt), jamais modifié
+    """
+    result = _run_git_readonly(repo_path, ["rev-parse", "--is-bare-repository"], timeout)
+    if result is None or result.returncode != 0 or result.stdout.strip() != "true":
+        return rel_path, _INVALID_REPO
+
+    result = _run_git_readonly(repo_path, ["symbolic-ref", "--short", "-q", "HEAD"], timeout)
+    if result is None:
+        return rel_path, _INVALID_REPO
+    # symbolic-ref échoue (code 1, sortie vide) quand HEAD est détaché
+    branch = result.stdout.strip() if result.returncode == 0 else ""
+    return rel_path, _LocalRepoInfo(branch=branch or "DETACHED", dirty=False)
+
+
+def _inspect_local_repo(root_dir: Path, repo_path: Path, timeout: int) -> tuple[str, _LocalRepoInfo]:
+    """Inspecte un dépôt local (branche courante, modifications).
+
+    Un seul processus `git status --porcelain=v2 --branch` fournit la branche
+    et l'état de l'arbre de travail, sans ouvrir le dépôt via GitPython. Les
+    dépôts bare (sans entrée .git) passent par _inspect_bare_repo.
+
+    Args:
+        root_dir: Répertoire racine de synchronisation
+        repo_path: Chemin du dépôt
+        timeout: Timeout de la commande git (secondes)
+
+    Returns:
+        Tuple (chemin relatif, informations du dépôt)
+    """
+    rel_path = str(repo_path.relative_to(root_dir))
+    if not (repo_path / ".git").exists():
+        return _inspect_bare_repo(rel_path, repo_path, timeout)
+
+    result = _run_git_readonly(repo_path, ["status", "--porcelain=v2", "--branch"], timeout)
+    if result is None or result.returncode != 0:
+        return rel_path, _INVALID_REPO
+
+    branch = "?"
+    dirty = False
+    for line in result.stdout.splitlines():
+        if line.startswith("# branch.head "):
+            head = line[len("# branch.head "):]
+            branch = "DETACHED" if head == "(detached)" else head
+        elif line and not line.startswith("#"):
+            dirty = True
+            break
+    if dirty:
+        from .git_operations import index_is_empty
+
+        # Clone sans checkout : l'index vide fait apparaître chaque fichier
+        # suivi comme une suppression indexée, le dépôt n'est pas modifié
+        dirty = not index_is_empty(repo_path)
+    return rel_path, _LocalRepoInfo(branch=branch, dirty=dirty)
+
+
 @cli.command("status")
 @click.option(
     "--group",
@@ -532,6 +824,8 @@ def status_cmd(
     json_output: bool,
 ) -> None:
     """Compare l'état GitLab vs local pour un groupe."""
+    from .config import load_config
+    from .git_operations import find_git_repositories
     from .gitlab_api import GitLabClient
 
     try:
@@ -552,55 +846,51 @@ def status_cmd(
 
         # Récupérer les projets GitLab
         gitlab_projects = gitlab_client.discover_all_projects(list(groups))
-        gitlab_paths = {p.path_with_namespace for p in gitlab_projects}
+        gitlab_paths = frozenset(p.path_with_namespace for p in gitlab_projects)
 
         if not json_output:
             console.print(f"[green]✓ {len(gitlab_projects)} projets trouvés sur GitLab[/green]\n")
 
         # Scanner les repos locaux
         local_paths: set[str] = set()
-        local_repos: dict[str, dict] = {}
+        local_repos: dict[str, _LocalRepoInfo] = {}
 
         if config.root_dir.exists():
-            for git_path in config.root_dir.rglob(".git"):
-                repo_path = git_path.parent
-                try:
-                    rel_path = str(repo_path.relative_to(config.root_dir))
+            repo_paths = list(find_git_repositories(config.root_dir))
+
+            # Inspection en parallèle (I/O disque + processus git)
+            with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
+                inspected = executor.map(
+                    lambda repo_path: _inspect_local_repo(
+                        config.root_dir, repo_path, config.git_timeout
+                    ),
+                    repo_paths,
+                )
+                for rel_path, info in inspected:
                     local_paths.add(rel_path)
-
-                    repo = git.Repo(repo_path)
-                    local_repos[rel_path] = {
-                        "branch": repo.active_branch.name if not repo.head.is_detached else "DETACHED",
-                        "dirty": repo.is_dirty(untracked_files=True),
-                    }
-                except Exception:
-                    local_repos[rel_path] = {"error": True}
-
-        # Classifier les projets
-        synced = []  # Sur GitLab ET en local
-        missing = []  # Sur GitLab mais PAS en local
-        orphans = []  # En local mais PAS sur GitLab
-
-        for project in gitlab_projects:
-            path = project.path_with_namespace
-            if path in local_paths:
-                info = local_repos.get(path, {})
-                synced.append({
-                    "path": path,
-                    "branch": info.get("branch", "?"),
-                    "dirty": info.get("dirty", False),
-                    "error": info.get("error", False),
-                })
-            else:
-                missing.append({"path": path})
-
-        for local_path in local_paths:
-            if local_path not in gitlab_paths:
-                info = local_repos.get(local_path, {})
-                orphans.append({
-                    "path": local_path,
-                    "branch": info.get("branch", "?"),
-                })
+                    local_repos[rel_path] = info
+
+        # Classifier les projets (opérations ensemblistes)
+        synced_paths = gitlab_paths & local_paths  # Sur GitLab ET en local
+        missing_paths = gitlab_paths - local_paths  # Sur GitLab mais PAS en local
+        orphan_paths = local_paths - gitlab_paths  # En local mais PAS sur GitLab
+
+        # Listes triées une seule fois par chemin (tri natif des str, sans
+        # fonction clé) : tableaux et JSON les réutilisent telles quelles
+        synced = [
+            {
+                "path": path,
+                "branch": local_repos[path].branch,
+                "dirty": local_repos[path].dirty,
+                "error": local_repos[path].error,
+            }
+            for path in sorted(synced_paths)
+        ]
+        missing = [{"path": path} for path in sorted(missing_paths)]
+        orphans = [
+            {"path": path, "branch": local_repos[path].branch}
+            for path in sorted(orphan_paths)
+        ]
 
         # Sortie
         if json_output:
@@ -616,7 +906,7 @@ def status_cmd(
                     "orphans": orphans,
                 },
             }
-            print(json.dumps(output, indent=2))
+            print_json(output)
         else:
             console.print(f"[cyan]📁 Répertoire:[/cyan] {config.root_dir}\n")
 
@@ -627,7 +917,7 @@ def status_cmd(
                 table.add_column("Branche", style="blue")
                 table.add_column("État", justify="center")
 
-                for repo in sorted(synced, key=lambda x: x["path"]):
+                for repo in synced:
                     if repo.get("error"):
                         table.add_row(repo["path"], "-", "[red]ERREUR[/red]")
                     else:
@@ -641,7 +931,7 @@ def status_cmd(
                 table = Table(title=f"[red]✗ Non clonés ({len(missing)})[/red]")
                 table.add_column("Projet GitLab", style="red")
 
-                for repo in sorted(missing, key=lambda x: x["path"]):
+                for repo in missing:
                     table.add_row(repo["path"])
                 console.print(table)
                 console.print()
@@ -652,7 +942,7 @@ def status_cmd(
                 table.add_column("Projet local", style="yellow")
                 table.add_column("Branche", style="dim")
 
-                for repo in sorted(orphans, key=lambda x: x["path"]):
+                for repo in orphans:
                     table.add_row(repo["path"], repo.get("branch", "?"))
                 console.print(table)
                 console.print()
@@ -681,6 +971,15 @@ def status_cmd(
 @click.option("--debug", "-d", is_flag=True, help="Afficher les informations de debug.")
 def config_cmd(debug: bool) -> None:
     """Affiche la configuration actuelle et les fichiers utilisés."""
+    from .config import (
+        config_locations,
+        debug_config,
+        env_locations,
+        find_config_file,
+        find_env_file,
+        load_config,
+    )
+
     print_banner()
 
     # Fichiers de configuration trouvés
@@ -748,14 +1047,12 @@ def config_cmd(debug: bool) -> None:
 
         console.print("\n[bold cyan]📍 Emplacements recherchés[/bold cyan]\n")
         console.print("[dim]Fichiers TOML (par ordre de priorité) :[/dim]")
-        from .config import CONFIG_LOCATIONS
-        for loc in CONFIG_LOCATIONS:
+        for loc in config_locations():
             exists = "[green]✓[/green]" if loc.exists() else "[dim]✗[/dim]"
             console.print(f"  {exists} {loc}")
 
         console.print("\n[dim]Fichiers .env (par ordre de priorité) :[/dim]")
-        from .config import ENV_LOCATIONS
-        for loc in ENV_LOCATIONS:
+        for loc in env_locations():
             exists = "[green]✓[/green]" if loc.exists() else "[dim]✗[/dim]"
             console.print(f"  {exists} {loc}")
 
@@ -897,6 +1194,20 @@ prune = true
     console.print()
 
 
+def _walk_dirs(root: str) -> Iterator[tuple[str, list[str], list[str]]]:
+    """Parcourt une arborescence de haut en bas (dirnames modifiable).
+
+    Utilise os.fwalk quand il est disponible (Linux, macOS) : chaque niveau
+    est listé relativement au descripteur du dossier parent, sans résoudre
+    à nouveau le chemin complet. Repli sur os.walk ailleurs (Windows).
+    """
+    if hasattr(os, "fwalk"):
+        for dirpath, dirnames, filenames, _dirfd in os.fwalk(root, topdown=True):
+            yield dirpath, dirnames, filenames
+    else:
+        yield from os.walk(root, topdown=True)
+
+
 @cli.command("clean")
 @click.option(
     "--root-dir",
@@ -920,6 +1231,8 @@ def clean_cmd(root_dir: Optional[Path], dry_run: bool, force: bool) -> None:
     """Supprime les dépôts qui ne sont plus sur GitLab ou les dossiers vides."""
     # Déterminer le répertoire
     if root_dir is None:
+        from .config import load_config
+
         config = load_config()
         root_dir = config.root_dir
 
@@ -930,29 +1243,25 @@ def clean_cmd(root_dir: Optional[Path], dry_run: bool, force: bool) -> None:
     print_banner()
     console.print(f"\n[cyan]🧹 Nettoyage de:[/cyan] {root_dir}\n")
 
-    # Trouver les dossiers vides (exclure .git)
+    # Trouver les dossiers vides (sans jamais descendre dans .git)
     empty_dirs: list[Path] = []
-    for dirpath, dirnames, filenames in os.walk(root_dir, topdown=False):
-        path = Path(dirpath)
-        if path == root_dir:
-            continue
-        # Ignorer tout ce qui est dans .git
-        if ".git" in path.parts:
-            continue
-        # Dossier vide (ou contient seulement des dossiers vides)
-        if not filenames and not dirnames:
-            empty_dirs.append(path)
-
-    # Trouver les dépôts avec remote invalide
+    root_str = os.fspath(root_dir)
+    for dirpath, dirnames, filenames in _walk_dirs(root_str):
+        # Dossier vide (ni fichier, ni sous-dossier, .git compris)
+        if not filenames and not dirnames and dirpath != root_str:
+            empty_dirs.append(Path(dirpath))
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+        elif "HEAD" in filenames and "objects" in dirnames and "refs" in dirnames:
+            # Dépôt bare : ses dossiers internes (refs/tags...) peuvent être vides
+            dirnames.clear()
+
+    # Trouver les dépôts invalides (.git/config absent ou illisible)
+    from .git_operations import find_git_repositories, read_remote_names
+
     invalid_repos: list[Path] = []
-    for git_path in root_dir.rglob(".git"):
-        repo_path = git_path.parent
-        try:
-            repo = git.Repo(repo_path)
-            if "origin" in [r.name for r in repo.remotes]:
-                # Vérifier si le remote existe encore (optionnel, peut être lent)
-                pass
-        except Exception:
+    for repo_path in find_git_repositories(root_dir):
+        if read_remote_names(repo_path) is None:
             invalid_repos.append(repo_path)
 
     # Afficher ce qui sera supprimé
@@ -1,82 +1,202 @@
 """Gestion de la configuration de LOGISCO GitLab Mirror."""
 
+import fnmatch
 import os
-import sys
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Sequence
 
-from pydantic import Field, field_validator
-from pydantic_settings import BaseSettings, SettingsConfigDict
+try:
+    import tomllib
+except ImportError:  # pragma: no cover - Python < 3.11
+    import tomli as tomllib  # type: ignore[no-redef]
 
-# Emplacements de configuration par ordre de priorité
-CONFIG_LOCATIONS = [
-    Path.cwd() / ".lgm.toml",                    # Répertoire courant
-    Path.cwd() / "lgm.toml",                     # Répertoire courant (alt)
+from pydantic import Field, field_validator
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+# Noms recherchés dans le répertoire courant, résolu à chaque recherche :
+# un processus peut changer de répertoire entre deux appels
+_CWD_CONFIG_NAMES = (".lgm.toml", "lgm.toml")
+_CWD_ENV_NAMES = (".env", ".lgm.env")
+
+# Emplacements fixes, par ordre de priorité après le répertoire courant
+_STATIC_CONFIG_LOCATIONS = (
     Path.home() / ".config" / "lgm" / "config.toml",  # XDG config
     Path.home() / ".lgm.toml",                   # Home utilisateur
     Path("/etc/lgm/config.toml"),                # Config système (Linux)
-]
+)
 
-ENV_LOCATIONS = [
-    Path.cwd() / ".env",                         # Répertoire courant
-    Path.cwd() / ".lgm.env",                     # Répertoire courant (spécifique)
+_STATIC_ENV_LOCATIONS = (
     Path.home() / ".config" / "lgm" / ".env",    # XDG config
     Path.home() / ".lgm.env",                    # Home utilisateur
-]
+)
 
 
-def find_config_file() -> Optional[Path]:
-    """Trouve le fichier de configuration TOML."""
-    for path in CONFIG_LOCATIONS:
-        if path.exists():
+def config_locations(cwd: Optional[Path] = None) -> tuple[Path, ...]:
+    """Emplacements du fichier TOML par ordre de priorité."""
+    base = cwd or Path.cwd()
+    return tuple(base / name for name in _CWD_CONFIG_NAMES) + _STATIC_CONFIG_LOCATIONS
+
+
+def env_locations(cwd: Optional[Path] = None) -> tuple[Path, ...]:
+    """Emplacements du fichier .env par ordre de priorité."""
+    base = cwd or Path.cwd()
+    return tuple(base / name for name in _CWD_ENV_NAMES) + _STATIC_ENV_LOCATIONS
+
+
+def _first_existing(locations: tuple[Path, ...]) -> Optional[Path]:
+    """Retourne le premier emplacement existant, dans l'ordre de priorité.
+
+    Chaque dossier parent n'est listé qu'une fois (os.scandir) au lieu d'un
+    stat() par candidat : cwd et ~/.config/lgm portent plusieurs candidats.
+    """
+    listings: dict[Path, frozenset[str]] = {}
+    for path in locations:
+        parent = path.parent
+        names = listings.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent) as it:
+                    names = frozenset(entry.name for entry in it)
+            except OSError:
+                names = frozenset()
+            listings[parent] = names
+        if path.name in names:
             return path
     return None
 
 
+def find_config_file() -> Optional[Path]:
+    """Trouve le fichier de configuration TOML."""
+    return _find_config_file(Path.cwd())
+
+
 def find_env_file() -> Optional[str]:
     """Trouve le fichier .env."""
-    for path in ENV_LOCATIONS:
-        if path.exists():
-            return str(path)
-    return None
+    return _find_env_file(Path.cwd())
+
+
+# Recherches mémorisées par répertoire courant : une seule fois par processus
+# tant que celui-ci ne change pas de répertoire
+@lru_cache(maxsize=8)
+def _find_config_file(cwd: Path) -> Optional[Path]:
+    return _first_existing(config_locations(cwd))
+
+
+@lru_cache(maxsize=8)
+def _find_env_file(cwd: Path) -> Optional[str]:
+    path = _first_existing(env_locations(cwd))
+    return str(path) if path is not None else None
+
+
+# Fichiers TOML déjà lus : chemin → (st_mtime_ns, st_size, contenu)
+_TOML_CACHE: dict[Path, tuple[int, int, dict[str, Any]]] = {}
 
 
 def load_toml_config() -> dict[str, Any]:
-    """Charge la configuration depuis un fichier TOML."""
+    """Charge la configuration depuis un fichier TOML.
+
+    Le contenu est mis en cache tant que la date de modification et la taille
+    du fichier ne changent pas : un seul stat() par appel ultérieur. Le
+    dictionnaire retourné est partagé et ne doit pas être modifié.
+    """
     config_path = find_config_file()
     if not config_path:
         return {}
 
     try:
-        if sys.version_info >= (3, 11):
-            import tomllib
-            with open(config_path, "rb") as f:
-                return tomllib.load(f)
-        else:
-            import tomli
-            with open(config_path, "rb") as f:
-                return tomli.load(f)
+        st = os.stat(config_path)
+        cached = _TOML_CACHE.get(config_path)
+        if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+            return cached[2]
+
+        with open(config_path, "rb") as f:
+            data = tomllib.load(f)
     except Exception:
         return {}
 
+    _TOML_CACHE[config_path] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+# Ligne "CLE = valeur" d'un fichier .env (commentaires et lignes sans "=" ignorés)
+_ENV_LINE_RE = re.compile(r"^[^\S\n]*([^#\s=][^=\n]*?)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$", re.M)
+
 
 def _load_env_file_manually() -> dict[str, str]:
     """Charge manuellement le fichier .env pour debug."""
     env_file = find_env_file()
     if not env_file:
         return {}
-    
-    result = {}
+
     try:
         with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    key, _, value = line.partition("=")
-                    result[key.strip()] = value.strip()
+            return dict(_ENV_LINE_RE.findall(f.read()))
     except Exception:
-        pass
-    return result
+        return {}
+
+
+@lru_cache(maxsize=32)
+def compile_patterns(patterns: tuple[str, ...]) -> Optional[re.Pattern[str]]:
+    """Compile des patterns fnmatch en une seule expression régulière.
+
+    Chaque glob est traduit une seule fois puis les alternatives sont
+    fusionnées : un seul appel à match() par chemin de projet. Chaque
+    alternative est un groupe nommé p<index> : match.lastgroup désigne le
+    premier pattern qui correspond (voir matched_pattern).
+
+    Comme fnmatch.fnmatch, les patterns passent par os.path.normcase
+    (insensibles à la casse sous Windows) : comparer l'expression à des
+    chemins normalisés de la même façon.
+
+    Args:
+        patterns: Patterns fnmatch (ex: '*/test-*')
+
+    Returns:
+        Expression compilée, ou None si aucun pattern
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        "|".join(
+            f"(?P<p{i}>{fnmatch.translate(os.path.normcase(p))})" for i, p in enumerate(patterns)
+        )
+    )
+
+
+def matched_pattern(match: re.Match[str], patterns: Sequence[str]) -> str:
+    """Retrouve le pattern d'origine d'une correspondance de compile_patterns.
+
+    Args:
+        match: Résultat de match() sur l'expression de compile_patterns(patterns)
+        patterns: Patterns compilés, dans le même ordre
+
+    Returns:
+        Le glob qui a produit la correspondance
+    """
+    return patterns[int(match.lastgroup[1:])] if match.lastgroup else "unknown"
+
+
+def default_max_workers() -> int:
+    """Nombre de threads par défaut, proportionnel aux CPU de la machine.
+
+    Clones et fetchs attendent surtout le réseau et les processus git : on
+    vise 4 threads par CPU, dans la limite autorisée de 32.
+
+    Returns:
+        min(32, nombre de CPU * 4)
+    """
+    return min(32, (os.cpu_count() or 1) * 4)
+
+
+# Filtres de partial clone acceptés (git clone --filter=...)
+_PARTIAL_CLONE_FILTER_RE = re.compile(r"blob:none|tree:0|blob:limit=\d+[kmg]?")
 
 
 class Config(BaseSettings):
@@ -95,12 +215,24 @@ class Config(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_prefix="GITLAB_",
-        env_file=find_env_file(),
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
     )
 
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Résout le fichier .env à l'instanciation plutôt qu'à l'import du module."""
+        dotenv_settings = DotEnvSettingsSource(settings_cls, env_file=find_env_file())
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
+
     # Configuration GitLab - ATTENTION: avec env_prefix="GITLAB_"
     # Le champ "url" correspond à la variable GITLAB_URL
     # Le champ "token" correspond à GITLAB_TOKEN
@@ -148,19 +280,43 @@ class Config(BaseSettings):
         default=0,
         description="Ne pas mettre à jour si fetch récent (0 = désactivé)",
     )
+    trust_last_activity: bool = Field(
+        default=False,
+        description="Ne pas mettre à jour un dépôt fetché après la dernière activité GitLab",
+    )
+    ls_remote_ttl: float = Field(
+        default=0,
+        ge=0,
+        description="Validité en secondes du cache disque des sondes ls-remote (0 = désactivé)",
+    )
 
     # Options de performance
     max_workers: int = Field(
-        default=4,
+        default_factory=default_max_workers,
         ge=1,
         le=32,
         description="Nombre de threads pour le clonage/mise à jour parallèle (1-32)",
     )
+    discovery_workers: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=64,
+        description="Threads de découverte via l'API GitLab (1-64, défaut: max_workers)",
+    )
     git_timeout: int = Field(
         default=300,
         ge=30,
         description="Timeout pour les opérations Git en secondes",
     )
+    ssh_multiplex: bool = Field(
+        default=False,
+        description="Partager une connexion SSH (ControlMaster) entre les commandes git",
+    )
+    fetch_jobs: int = Field(
+        default=8,
+        ge=1,
+        description="Fetchs parallèles par dépôt (git fetch --jobs, remotes et sous-modules)",
+    )
     max_retries: int = Field(
         default=3,
         ge=0,
@@ -191,6 +347,18 @@ class Config(BaseSettings):
         default=False,
         description="Partial clone: télécharge les blobs à la demande (pour gros repos)",
     )
+    partial_clone_filter: str = Field(
+        default="",
+        description="Filtre de partial clone : blob:none, tree:0 ou blob:limit=<n> (prioritaire)",
+    )
+    no_checkout: bool = Field(
+        default=False,
+        description="Cloner sans checkout (métadonnées seules, objets récupérés au checkout)",
+    )
+    bare_clone: bool = Field(
+        default=False,
+        description="Cloner en dépôt bare, sans copie de travail (miroir pur)",
+    )
     prune: bool = Field(
         default=False,
         description="Supprimer les branches distantes supprimées (git fetch --prune)",
@@ -244,6 +412,35 @@ class Config(BaseSettings):
         """Setter pour compatibilité."""
         self.url = value
 
+    @property
+    def clone_options(self) -> dict[str, Any]:
+        """Options de clonage dérivées de la config (nom d'option git clone -> valeur)."""
+        options: dict[str, Any] = {}
+        # Shallow clone
+        if self.clone_depth > 0:
+            options["depth"] = self.clone_depth
+        # Single branch (clone uniquement la branche par défaut)
+        if self.single_branch:
+            options["single_branch"] = True
+        # Partial clone (filter blobs) - pour les très gros repos ; tree:0 ne
+        # télécharge même pas les arbres, récupérés à la demande par git
+        if self.partial_clone_filter:
+            options["filter"] = self.partial_clone_filter
+        elif self.filter_blobs:
+            options["filter"] = "blob:none"
+        # Sans checkout : un `git checkout` ultérieur récupère les objets manquants
+        if self.no_checkout and not self.bare_clone:
+            options["no_checkout"] = True
+        # Dépôt bare : pas de checkout, les fichiers ne sont écrits qu'une fois (pack)
+        if self.bare_clone:
+            options["bare"] = True
+        return options
+
+    @property
+    def discovery_thread_count(self) -> int:
+        """Threads de la découverte API (requêtes HTTPS, indépendants des clones)."""
+        return self.discovery_workers or self.max_workers
+
     @field_validator("token")
     @classmethod
     def validate_token(cls, v: str) -> str:
@@ -260,6 +457,16 @@ class Config(BaseSettings):
         """Convertit en Path absolu."""
         return v.expanduser().resolve()
 
+    @field_validator("partial_clone_filter")
+    @classmethod
+    def validate_partial_clone_filter(cls, v: str) -> str:
+        """Valide le filtre de partial clone."""
+        if v and not _PARTIAL_CLONE_FILTER_RE.fullmatch(v):
+            raise ValueError(
+                "partial_clone_filter doit être 'blob:none', 'tree:0' ou 'blob:limit=<n>[kmg]'"
+            )
+        return v
+
     @field_validator("clone_method")
     @classmethod
     def validate_clone_method(cls, v: str) -> str:
@@ -282,6 +489,121 @@ class Config(BaseSettings):
         self.root_dir.mkdir(parents=True, exist_ok=True)
 
 
+def _to_list(value: Any) -> list[str]:
+    """Accepte un pattern seul ou une liste de patterns."""
+    return value if isinstance(value, list) else [value]
+
+
+# Correspondance TOML → Config : (clé TOML, champ Config, conversion éventuelle)
+# Le champ "url" est désigné par son alias "gitlab_url", seul nom accepté
+# à la construction de Config
+_TomlKeys = tuple[tuple[str, str, Optional[Callable[[Any], Any]]], ...]
+
+# Clés au niveau racine ("url" appliquée après "gitlab_url" : elle l'emporte)
+_TOML_ROOT_KEYS: _TomlKeys = (
+    ("gitlab_url", "gitlab_url", None),
+    ("url", "gitlab_url", None),
+    ("token", "token", None),
+    ("root_dir", "root_dir", None),
+    ("clone_method", "clone_method", None),
+    ("dry_run", "dry_run", None),
+    ("update_existing", "update_existing", None),
+    ("json_output", "json_output", None),
+    ("include_archived", "include_archived", None),
+    ("since_days", "since_days", None),
+    ("log_file", "log_file", None),
+)
+
+# Sections [performance], [smart_update], [clone] et [filters]
+_TOML_SECTIONS: dict[str, _TomlKeys] = {
+    "performance": (
+        ("max_workers", "max_workers", None),
+        ("discovery_workers", "discovery_workers", None),
+        ("git_timeout", "git_timeout", None),
+        ("fetch_jobs", "fetch_jobs", None),
+        ("ssh_multiplex", "ssh_multiplex", None),
+    ),
+    "smart_update": (
+        ("enabled", "smart_update", None),
+        ("skip_recent_hours", "skip_recent_hours", None),
+        ("ls_remote_ttl", "ls_remote_ttl", None),
+        ("trust_last_activity", "trust_last_activity", None),
+    ),
+    "clone": (
+        ("depth", "clone_depth", None),
+        ("prune", "prune", None),
+        ("single_branch", "single_branch", None),
+        ("filter_blobs", "filter_blobs", None),
+        ("filter", "partial_clone_filter", None),
+        ("no_checkout", "no_checkout", None),
+        ("bare", "bare_clone", None),
+    ),
+    "filters": (
+        ("exclude", "exclude_patterns", _to_list),
+        ("include", "include_patterns", _to_list),
+    ),
+}
+
+# Anciennes clés racine (compatibilité), ignorées si leur section est présente
+_TOML_LEGACY_KEYS: dict[str, _TomlKeys] = {
+    "smart_update": (("skip_recent_hours", "skip_recent_hours", None),),
+    "performance": (
+        ("max_workers", "max_workers", None),
+        ("git_timeout", "git_timeout", None),
+    ),
+    "clone": (
+        ("clone_depth", "clone_depth", None),
+        ("single_branch", "single_branch", None),
+        ("filter_blobs", "filter_blobs", None),
+        ("prune", "prune", None),
+    ),
+    "filters": (
+        ("exclude_patterns", "exclude_patterns", _to_list),
+        ("include_patterns", "include_patterns", _to_list),
+    ),
+}
+
+
+def _collect_toml_keys(
+    values: dict[str, Any], source: dict[str, Any], keys: _TomlKeys
+) -> None:
+    """Reporte dans values les clés présentes dans un dictionnaire TOML."""
+    for key, field, convert in keys:
+        value = source.get(key)
+        if value is not None:
+            values[field] = convert(value) if convert else value
+
+
+def _toml_values(toml_config: dict[str, Any]) -> dict[str, Any]:
+    """Convertit le contenu d'un fichier TOML en valeurs de champs Config.
+
+    Une seule passe sur des tables déclaratives : chaque clé n'est cherchée
+    qu'une fois, les sections ayant priorité sur les anciennes clés racine.
+
+    Args:
+        toml_config: Contenu du fichier TOML
+
+    Returns:
+        Valeurs à passer au constructeur de Config
+    """
+    values: dict[str, Any] = {}
+    _collect_toml_keys(values, toml_config, _TOML_ROOT_KEYS)
+
+    for name, keys in _TOML_SECTIONS.items():
+        section = toml_config.get(name)
+        if isinstance(section, dict):
+            _collect_toml_keys(values, section, keys)
+        elif section is not None and name == "smart_update":
+            # Forme racine "smart_update = true" (sans section)
+            values["smart_update"] = section
+
+    for name, keys in _TOML_LEGACY_KEYS.items():
+        if name not in toml_config:
+            _collect_toml_keys(values, toml_config, keys)
+
+    return values
+
+
 def load_config(
     gitlab_url: Optional[str] = None,
     token: Optional[str] = None,
@@ -299,6 +621,9 @@ def load_config(
     clone_depth: Optional[int] = None,
     single_branch: Optional[bool] = None,
     filter_blobs: Optional[bool] = None,
+    partial_clone_filter: Optional[str] = None,
+    no_checkout: Optional[bool] = None,
+    bare_clone: Optional[bool] = None,
     json_output: Optional[bool] = None,
     prune: Optional[bool] = None,
     include_archived: Optional[bool] = None,
@@ -307,158 +632,120 @@ def load_config(
     git_timeout: Optional[int] = None,
 ) -> Config:
     """Charge la configuration avec priorité aux arguments CLI.
-    
+
+    Le résultat est mémorisé pour le processus : des appels répétés avec les
+    mêmes arguments, le même environnement GITLAB_* et des fichiers de
+    configuration inchangés ne relisent ni le fichier TOML ni le fichier .env.
+    Chaque appel retourne une copie indépendante de la configuration.
+
     Ordre de priorité (du plus faible au plus fort) :
     1. Valeurs par défaut de la classe Config
     2. Variables d'environnement / fichier .env
     3. Fichier TOML (config.toml, .lgm.toml, etc.)
     4. Arguments CLI
     """
-    # Charger la config de base depuis les variables d'environnement / fichier .env
-    config = Config()
-    
-    # Charger le fichier TOML et appliquer les valeurs
+    arguments = (
+        ("gitlab_url", gitlab_url),
+        ("token", token),
+        ("root_dir", root_dir),
+        ("dry_run", dry_run),
+        ("verbose", verbose),
+        ("debug", debug),
+        ("clone_method", clone_method),
+        ("update_existing", update_existing),
+        ("smart_update", smart_update),
+        ("skip_recent_hours", skip_recent_hours),
+        ("max_workers", max_workers),
+        ("exclude_patterns", exclude_patterns),
+        ("include_patterns", include_patterns),
+        ("clone_depth", clone_depth),
+        ("single_branch", single_branch),
+        ("filter_blobs", filter_blobs),
+        ("partial_clone_filter", partial_clone_filter),
+        ("no_checkout", no_checkout),
+        ("bare_clone", bare_clone),
+        ("json_output", json_output),
+        ("prune", prune),
+        ("include_archived", include_archived),
+        ("since_days", since_days),
+        ("log_file", log_file),
+        ("git_timeout", git_timeout),
+    )
+    # Seuls les arguments fournis entrent dans la clé de cache (listes figées
+    # en tuples pour être hashables)
+    overrides = tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in arguments
+        if value is not None
+    )
+    # Copie profonde : l'appelant peut modifier sa config sans altérer le cache
+    return _load_config_cached(Path.cwd(), _config_sources(), overrides).model_copy(deep=True)
+
+
+def _file_signature(path: Optional[str | Path]) -> Optional[tuple[str, int, int]]:
+    """Identifie l'état d'un fichier de configuration : (chemin, st_mtime_ns, st_size)."""
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return os.fspath(path), st.st_mtime_ns, st.st_size
+
+
+def _config_sources() -> tuple[Any, ...]:
+    """Empreinte des sources lues par Config, en plus des arguments CLI.
+
+    Variables d'environnement GITLAB_* et état (chemin, date, taille) des
+    fichiers TOML et .env : une modification de l'une d'elles invalide la
+    configuration mémorisée. Quelques stat(), sans relire les fichiers.
+    """
+    env = tuple(
+        sorted(
+            (name.upper(), value)
+            for name, value in os.environ.items()
+            if name.upper().startswith("GITLAB_")
+        )
+    )
+    return env, _file_signature(find_config_file()), _file_signature(find_env_file())
+
+
+def clear_config_cache() -> None:
+    """Vide les caches de configuration (après modification des fichiers de config)."""
+    _find_config_file.cache_clear()
+    _find_env_file.cache_clear()
+    _TOML_CACHE.clear()
+    _load_config_cached.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(
+    cwd: Path, sources: tuple[Any, ...], overrides: tuple[tuple[str, Any], ...]
+) -> Config:
+    """Construit la configuration pour un jeu d'arguments CLI figé (hashable).
+
+    Le répertoire courant fait partie de la clé de cache : il détermine les
+    fichiers de configuration trouvés. sources (voir _config_sources) change
+    avec l'environnement GITLAB_* et les fichiers TOML et .env.
+
+    Valeurs TOML et arguments CLI sont fusionnés puis passés en une fois au
+    constructeur : une seule validation, les variables d'environnement et le
+    fichier .env ne complétant que les champs non fournis.
+    """
     toml_config = load_toml_config()
-    if toml_config:
-        # Support des clés au niveau racine (pour compatibilité)
-        if "gitlab_url" in toml_config:
-            config.url = toml_config["gitlab_url"]
-        if "url" in toml_config:
-            config.url = toml_config["url"]
-        if "token" in toml_config:
-            config.token = toml_config["token"]
-        if "root_dir" in toml_config:
-            config.root_dir = Path(toml_config["root_dir"]).expanduser().resolve()
-        if "clone_method" in toml_config:
-            config.clone_method = toml_config["clone_method"]
-        if "dry_run" in toml_config:
-            config.dry_run = toml_config["dry_run"]
-        if "update_existing" in toml_config:
-            config.update_existing = toml_config["update_existing"]
-        
-        # Section [performance]
-        if "performance" in toml_config:
-            perf = toml_config["performance"]
-            if "max_workers" in perf:
-                config.max_workers = perf["max_workers"]
-            if "git_timeout" in perf:
-                config.git_timeout = perf["git_timeout"]
-        
-        # Section [smart_update]
-        if "smart_update" in toml_config:
-            smart = toml_config["smart_update"]
-            if "enabled" in smart:
-                config.smart_update = smart["enabled"]
-            if "skip_recent_hours" in smart:
-                config.skip_recent_hours = smart["skip_recent_hours"]
-        
-        # Section [clone]
-        if "clone" in toml_config:
-            clone = toml_config["clone"]
-            if "depth" in clone:
-                config.clone_depth = clone["depth"]
-            if "prune" in clone:
-                config.prune = clone["prune"]
-            if "single_branch" in clone:
-                config.single_branch = clone["single_branch"]
-            if "filter_blobs" in clone:
-                config.filter_blobs = clone["filter_blobs"]
-        
-        # Section [filters]
-        if "filters" in toml_config:
-            filters = toml_config["filters"]
-            if "exclude" in filters:
-                patterns = filters["exclude"]
-                config.exclude_patterns = patterns if isinstance(patterns, list) else [patterns]
-            if "include" in filters:
-                patterns = filters["include"]
-                config.include_patterns = patterns if isinstance(patterns, list) else [patterns]
-        
-        # Autres clés au niveau racine (pour compatibilité, seulement si pas dans une section)
-        # Note: Les sections ont la priorité, donc on ne surcharge que si la clé n'est pas une section
-        if "smart_update" in toml_config and not isinstance(toml_config["smart_update"], dict):
-            config.smart_update = toml_config["smart_update"]
-        if "skip_recent_hours" in toml_config and "smart_update" not in toml_config:
-            # Seulement si pas déjà défini dans la section smart_update
-            config.skip_recent_hours = toml_config["skip_recent_hours"]
-        if "max_workers" in toml_config and "performance" not in toml_config:
-            # Seulement si pas déjà défini dans la section performance
-            config.max_workers = toml_config["max_workers"]
-        if "clone_depth" in toml_config and "clone" not in toml_config:
-            # Seulement si pas déjà défini dans la section clone
-            config.clone_depth = toml_config["clone_depth"]
-        if "single_branch" in toml_config and "clone" not in toml_config:
-            config.single_branch = toml_config["single_branch"]
-        if "filter_blobs" in toml_config and "clone" not in toml_config:
-            config.filter_blobs = toml_config["filter_blobs"]
-        if "prune" in toml_config and "clone" not in toml_config:
-            config.prune = toml_config["prune"]
-        if "git_timeout" in toml_config and "performance" not in toml_config:
-            config.git_timeout = toml_config["git_timeout"]
-        if "json_output" in toml_config:
-            config.json_output = toml_config["json_output"]
-        if "include_archived" in toml_config:
-            config.include_archived = toml_config["include_archived"]
-        if "since_days" in toml_config:
-            config.since_days = toml_config["since_days"]
-        if "log_file" in toml_config:
-            config.log_file = toml_config["log_file"]
-        if "exclude_patterns" in toml_config and "filters" not in toml_config:
-            patterns = toml_config["exclude_patterns"]
-            config.exclude_patterns = patterns if isinstance(patterns, list) else [patterns]
-        if "include_patterns" in toml_config and "filters" not in toml_config:
-            patterns = toml_config["include_patterns"]
-            config.include_patterns = patterns if isinstance(patterns, list) else [patterns]
-
-    # Surcharger avec les arguments CLI fournis (priorité la plus haute)
-    if gitlab_url is not None:
-        config.url = gitlab_url
-    if token is not None:
-        config.token = token
-    if root_dir is not None:
-        config.root_dir = root_dir.expanduser().resolve()
-    if clone_method is not None:
-        config.clone_method = clone_method
-    if dry_run is not None:
-        config.dry_run = dry_run
-    if verbose is not None:
-        config.verbose = verbose
-    if debug is not None:
-        config.debug = debug
-        if debug:
-            config.verbose = True  # debug implique verbose
-    if update_existing is not None:
-        config.update_existing = update_existing
-    if smart_update is not None:
-        config.smart_update = smart_update
-    if skip_recent_hours is not None:
-        config.skip_recent_hours = skip_recent_hours
-    if max_workers is not None:
-        config.max_workers = max_workers
-    if clone_depth is not None:
-        config.clone_depth = clone_depth
-    if single_branch is not None:
-        config.single_branch = single_branch
-    if filter_blobs is not None:
-        config.filter_blobs = filter_blobs
-    if json_output is not None:
-        config.json_output = json_output
-    if prune is not None:
-        config.prune = prune
-    if include_archived is not None:
-        config.include_archived = include_archived
-    if since_days is not None:
-        config.since_days = since_days
-    if log_file is not None:
-        config.log_file = log_file
-    if git_timeout is not None:
-        config.git_timeout = git_timeout
-    if exclude_patterns is not None:
-        config.exclude_patterns = list(exclude_patterns)
-    if include_patterns is not None:
-        config.include_patterns = list(include_patterns)
-
-    return config
+    values = _toml_values(toml_config) if toml_config else {}
+
+    # Arguments CLI fournis (priorité la plus haute) ; les noms correspondent
+    # aux champs de Config, "gitlab_url" étant l'alias du champ url
+    if overrides:
+        values.update(
+            (name, list(value) if isinstance(value, tuple) else value)
+            for name, value in overrides
+        )
+        if values.get("debug"):
+            values["verbose"] = True  # debug implique verbose
+
+    return Config(**values)
 
 
 def debug_config() -> dict[str, Any]:
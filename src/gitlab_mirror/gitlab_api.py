@@ -1,15 +1,45 @@
 """Client API GitLab pour la découverte des groupes et projets."""
 
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 
 import gitlab
+import requests
 from gitlab.exceptions import GitlabAuthenticationError, GitlabError, GitlabGetError
+from requests.adapters import HTTPAdapter
 
 from .config import Config
 from .logger import logger
 from .models import GitLabGroup, GitLabProject
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - dépendance optionnelle
+    orjson = None  # type: ignore[assignment]
+
+# Taille de page maximale de l'API REST GitLab (valeurs supérieures ramenées à 100)
+GITLAB_MAX_PER_PAGE = 100
+
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Convertit un horodatage ISO 8601 de l'API GitLab (None si absent ou invalide)."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _use_orjson(response: requests.Response, *args: Any, **kwargs: Any) -> requests.Response:
+    """Hook requests : décode le corps JSON de la réponse avec orjson."""
+    if "json" in response.headers.get("Content-Type", ""):
+        content = response.content
+        response.json = lambda **_: orjson.loads(content)  # type: ignore[method-assign]
+    return response
+
 
 class GitLabClient:
     """Client pour interagir avec l'API GitLab."""
@@ -33,6 +63,8 @@ class GitLabClient:
                 private_token=config.token,
                 timeout=config.api_timeout,
             )
+            self._configure_connection_pool()
+            self._configure_json_decoder()
             # Tester l'authentification
             self.client.auth()
             logger.info(f"Connecté à GitLab: {config.gitlab_url}")
@@ -45,6 +77,29 @@ class GitLabClient:
             logger.error(f"Erreur de connexion à GitLab: {e}")
             raise
 
+    def _configure_connection_pool(self) -> None:
+        """Dimensionne le pool de connexions keep-alive de la session HTTP.
+
+        Le pool par défaut de requests garde 10 connexions par host : avec
+        plus de threads (config.discovery_thread_count), les connexions
+        en trop seraient rouvertes puis jetées, avec une poignée de main TLS
+        à chaque requête. Pas de retry au niveau HTTP (géré par l'application).
+        """
+        pool_size = max(10, self.config.max_workers, self.config.discovery_thread_count)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        self.client.session.mount("https://", adapter)
+        self.client.session.mount("http://", adapter)
+
+    def _configure_json_decoder(self) -> None:
+        """Décode les réponses JSON de l'API avec orjson s'il est installé.
+
+        python-gitlab appelle response.json() sur chaque page de résultats : un
+        hook de réponse de la session le remplace par orjson.loads (extra
+        "performance"), plus rapide sur les listings de 100 projets par page.
+        """
+        if orjson is not None:
+            self.client.session.hooks["response"].append(_use_orjson)
+
     def resolve_group(self, group_identifier: str) -> Optional[GitLabGroup]:
         """Résout un groupe à partir de son ID ou chemin.
 
@@ -77,11 +132,13 @@ class GitLabClient:
             logger.error(f"Erreur lors de la résolution du groupe {group_identifier}: {e}")
             return None
 
-    def get_all_projects_fast(self, group_id: int) -> list[GitLabProject]:
+    def get_all_projects_fast(self, group_id: int) -> Iterator[GitLabProject]:
         """Récupère TOUS les projets d'un groupe ET ses sous-groupes en UNE requête.
 
         OPTIMISATION: Utilise include_subgroups=True pour éviter de scanner
-        chaque sous-groupe individuellement.
+        chaque sous-groupe individuellement. Les pages sont parcourues à la
+        demande (iterator=True) : les projets sont produits au fil de la
+        pagination, sans matérialiser toute la liste python-gitlab.
 
         Filtres appliqués:
         - archived: inclus seulement si config.include_archived=True
@@ -90,17 +147,19 @@ class GitLabClient:
         Args:
             group_id: ID du groupe racine
 
-        Returns:
-            Liste de tous les projets (incluant sous-groupes)
+        Yields:
+            Projets du groupe (incluant sous-groupes)
         """
-        projects: list[GitLabProject] = []
+        count = 0
 
         try:
             gl_group = self.client.groups.get(group_id)
 
-            # Options de requête
+            # Options de requête (100 par page : maximum accepté par l'API
+            # GitLab, 5x moins d'allers-retours que les 20 par défaut)
             list_kwargs: dict[str, Any] = {
-                "all": True,
+                "iterator": True,
+                "per_page": GITLAB_MAX_PER_PAGE,
                 "include_subgroups": True,
                 "with_shared": False,
             }
@@ -114,32 +173,29 @@ class GitLabClient:
                 since_date = datetime.now(timezone.utc) - timedelta(days=self.config.since_days)
                 list_kwargs["last_activity_after"] = since_date.isoformat()
 
-            gl_projects = gl_group.projects.list(**list_kwargs)
-
-            # Logging avec filtres actifs
-            filters_info = []
-            if not self.config.include_archived:
-                filters_info.append("non-archivés")
-            if self.config.since_days > 0:
-                filters_info.append(f"actifs depuis {self.config.since_days}j")
-
-            filter_str = f" ({', '.join(filters_info)})" if filters_info else ""
-            logger.info(f"  → {len(gl_projects)} projet(s) trouvé(s){filter_str}")
-
-            for gp in gl_projects:
-                project = self._convert_project_from_list(gp)
-                projects.append(project)
+            for gp in gl_group.projects.list(**list_kwargs):
+                count += 1
+                yield self._convert_project_from_list(gp)
 
         except GitlabError as e:
             logger.error(f"Erreur lors de la récupération des projets: {e}")
 
-        return projects
+        # Logging avec filtres actifs
+        filters_info = []
+        if not self.config.include_archived:
+            filters_info.append("non-archivés")
+        if self.config.since_days > 0:
+            filters_info.append(f"actifs depuis {self.config.since_days}j")
+
+        filter_str = f" ({', '.join(filters_info)})" if filters_info else ""
+        logger.info(f"  → {count} projet(s) trouvé(s){filter_str}")
 
     def discover_all_projects(self, group_identifiers: list[str]) -> list[GitLabProject]:
         """Découvre tous les projets à partir d'une liste de groupes.
 
         VERSION OPTIMISÉE: Une seule requête par groupe racine au lieu de
-        scanner chaque sous-groupe.
+        scanner chaque sous-groupe, et les groupes sont traités en parallèle
+        (config.discovery_thread_count threads au plus).
 
         Args:
             group_identifiers: Liste d'IDs ou chemins de groupes
@@ -147,30 +203,104 @@ class GitLabClient:
         Returns:
             Liste de tous les projets trouvés
         """
-        all_projects: list[GitLabProject] = []
-        processed_group_ids: set[int] = set()
+        if not group_identifiers:
+            return []
 
-        for identifier in group_identifiers:
-            logger.info(f"Résolution du groupe: {identifier}")
-            group = self.resolve_group(identifier)
+        # Requêtes réseau indépendantes : résolution des groupes puis listing
+        # de leurs projets en parallèle (le résultat garde l'ordre des groupes)
+        workers = min(len(group_identifiers), self.config.discovery_thread_count)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            unique_groups = self._resolve_unique_groups(executor, group_identifiers)
+            project_lists = executor.map(self._list_group_projects, unique_groups)
 
-            if not group:
-                logger.warning(f"Groupe ignoré (non trouvé): {identifier}")
-                continue
+            # Dédupliqués par ID de projet (ordre de première apparition conservé)
+            unique_projects: dict[int, GitLabProject] = {}
+            for projects in project_lists:
+                for project in projects:
+                    unique_projects[project.id] = project
+
+        return list(unique_projects.values())
+
+    def iter_all_projects(self, group_identifiers: list[str]) -> Iterator[GitLabProject]:
+        """Découvre les projets des groupes en les produisant au fil de la pagination.
+
+        Variante en flux de discover_all_projects : chaque groupe est paginé
+        dans son propre thread et les projets sont produits dès leur arrivée
+        (ordre entre groupes non garanti), ce qui permet de commencer à les
+        synchroniser pendant la découverte.
+
+        Args:
+            group_identifiers: Liste d'IDs ou chemins de groupes
 
-            if group.id in processed_group_ids:
-                continue
+        Yields:
+            Projets trouvés, dédupliqués par ID
+        """
+        if not group_identifiers:
+            return
+
+        workers = min(len(group_identifiers), self.config.discovery_thread_count)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            unique_groups = self._resolve_unique_groups(executor, group_identifiers)
+
+            # Chaque tâche dépose ses projets puis None (fin du groupe) dans la file
+            found: queue.Queue[Optional[GitLabProject]] = queue.Queue()
+
+            def produce(group: GitLabGroup) -> None:
+                try:
+                    logger.info(f"Scan du groupe: {group.full_path} (avec tous les sous-groupes)")
+                    for project in self.get_all_projects_fast(group.id):
+                        found.put(project)
+                finally:
+                    found.put(None)
+
+            futures = [executor.submit(produce, group) for group in unique_groups]
+
+            seen: set[int] = set()
+            remaining = len(futures)
+            while remaining:
+                project = found.get()
+                if project is None:
+                    remaining -= 1
+                elif project.id not in seen:
+                    seen.add(project.id)
+                    yield project
+
+            # Propager une éventuelle erreur inattendue d'un groupe
+            for future in futures:
+                future.result()
+
+    def _resolve_unique_groups(
+        self, executor: ThreadPoolExecutor, group_identifiers: list[str]
+    ) -> list[GitLabGroup]:
+        """Résout les groupes en parallèle et écarte les introuvables et doublons.
 
-            processed_group_ids.add(group.id)
-            logger.info(f"Scan du groupe: {group.full_path} (avec tous les sous-groupes)")
+        Args:
+            executor: Pool de threads de la découverte
+            group_identifiers: Liste d'IDs ou chemins de groupes
+
+        Returns:
+            Groupes trouvés, dans l'ordre des identifiants, sans doublon
+        """
+        groups = executor.map(self._resolve_group_logged, group_identifiers)
+
+        unique_groups: dict[int, GitLabGroup] = {}
+        for identifier, group in zip(group_identifiers, groups, strict=True):
+            if not group:
+                logger.warning(f"Groupe ignoré (non trouvé): {identifier}")
+            elif group.id not in unique_groups:
+                unique_groups[group.id] = group
+        return list(unique_groups.values())
 
-            # UNE SEULE requête pour tous les projets du groupe et sous-groupes
-            projects = self.get_all_projects_fast(group.id)
-            all_projects.extend(projects)
+    def _resolve_group_logged(self, identifier: str) -> Optional[GitLabGroup]:
+        """Résout un groupe (tâche de discover_all_projects)."""
+        logger.info(f"Résolution du groupe: {identifier}")
+        return self.resolve_group(identifier)
 
-        # Dédupliquer par ID de projet
-        unique_projects = {p.id: p for p in all_projects}.values()
-        return list(unique_projects)
+    def _list_group_projects(self, group: GitLabGroup) -> list[GitLabProject]:
+        """Liste les projets d'un groupe et sous-groupes (tâche de discover_all_projects)."""
+        logger.info(f"Scan du groupe: {group.full_path} (avec tous les sous-groupes)")
+        # UNE SEULE requête pour tous les projets du groupe et sous-groupes
+        return list(self.get_all_projects_fast(group.id))
 
     def _convert_project_from_list(self, gp: Any) -> GitLabProject:
         """Convertit un projet de la liste en modèle interne.
@@ -196,4 +326,5 @@ class GitLabClient:
             namespace_id=gp.namespace["id"],
             namespace_path=gp.namespace["full_path"],
             description=getattr(gp, "description", None),
+            last_activity_at=_parse_timestamp(getattr(gp, "last_activity_at", None)),
         )
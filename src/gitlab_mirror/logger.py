@@ -1,8 +1,15 @@
 """Configuration du système de logging."""
 
+import atexit
 import logging
+import queue
 import sys
-from typing import Optional
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
+
+# File d'attente des logs en mode queued (voir setup_logger et flush_logger)
+_log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue()
+_listener: Optional[QueueListener] = None
 
 
 class ColoredFormatter(logging.Formatter):
@@ -17,13 +24,31 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",
     }
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialise le formatter (TTY et niveaux colorés calculés une fois)."""
+        super().__init__(*args, **kwargs)
+        self._isatty = sys.stdout.isatty()
+        reset = self.COLORS["RESET"]
+        self._colored = {
+            level: f"{color}{level}{reset}"
+            for level, color in self.COLORS.items()
+            if level != "RESET"
+        }
+
     def format(self, record: logging.LogRecord) -> str:
-        """Formate un enregistrement de log avec des couleurs."""
-        if sys.stdout.isatty():
-            levelname = record.levelname
-            color = self.COLORS.get(levelname, self.COLORS["RESET"])
-            record.levelname = f"{color}{levelname}{self.COLORS['RESET']}"
-        return super().format(record)
+        """Formate un enregistrement de log avec des couleurs.
+
+        Le levelname d'origine est restauré : le même enregistrement passe
+        ensuite par les autres handlers (fichier de log sans codes ANSI).
+        """
+        if not self._isatty:
+            return super().format(record)
+        levelname = record.levelname
+        record.levelname = self._colored.get(levelname, levelname)
+        try:
+            return super().format(record)
+        finally:
+            record.levelname = levelname
 
 
 def setup_logger(
@@ -31,21 +56,34 @@ def setup_logger(
     verbose: bool = False,
     debug: bool = False,
     log_file: Optional[str] = None,
+    queued: bool = False,
 ) -> logging.Logger:
     """Configure et retourne un logger.
 
+    En mode queued, le logger ne fait que déposer les enregistrements dans
+    une file : un thread unique (QueueListener) les écrit sur la console et
+    dans le fichier. Les threads de synchronisation ne se disputent plus le
+    verrou du handler pendant les écritures ; flush_logger attend que la
+    file soit vidée.
+
     Args:
         name: Nom du logger
         verbose: Active le mode verbeux (INFO)
         debug: Active le mode debug (DEBUG)
         log_file: Chemin optionnel vers un fichier de log
+        queued: Écrire les logs depuis un thread dédié (synchronisation parallèle)
 
     Returns:
         Logger configuré
     """
+    global _listener
+
     logger = logging.getLogger(name)
 
-    # Éviter les duplications de handlers
+    # Éviter les duplications de handlers (et arrêter l'ancien listener)
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
     if logger.hasHandlers():
         logger.handlers.clear()
 
@@ -70,7 +108,7 @@ def setup_logger(
 
     console_formatter = ColoredFormatter(console_format, datefmt="%Y-%m-%d %H:%M:%S")
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = [console_handler]
 
     # Handler fichier optionnel
     if log_file:
@@ -79,10 +117,35 @@ def setup_logger(
         file_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         file_formatter = logging.Formatter(file_format, datefmt="%Y-%m-%d %H:%M:%S")
         file_handler.setFormatter(file_formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if queued:
+        _listener = QueueListener(_log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        logger.addHandler(QueueHandler(_log_queue))
+    else:
+        for handler in handlers:
+            logger.addHandler(handler)
 
     return logger
 
 
+def flush_logger() -> None:
+    """Attend que les logs en file (mode queued) soient écrits.
+
+    À appeler avant d'écrire directement sur la console, pour que les logs
+    des threads de synchronisation ne s'intercalent pas dans la sortie.
+    """
+    if _listener is not None:
+        _log_queue.join()
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Vide la file et arrête le listener à la sortie du processus."""
+    if _listener is not None:
+        _listener.stop()
+
+
 # Logger global par défaut
 logger = setup_logger()
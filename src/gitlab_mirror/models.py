@@ -1,6 +1,7 @@
 """Modèles de données pour GitLab Mirror."""
 
 from dataclasses import dataclass
+from datetime import datetime
 from enum import Enum
 from typing import Optional
 
@@ -17,7 +18,7 @@ class ProjectStatus(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class GitLabGroup:
     """Représente un groupe GitLab."""
 
@@ -28,7 +29,7 @@ class GitLabGroup:
     web_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class GitLabProject:
     """Représente un projet GitLab."""
 
@@ -42,9 +43,10 @@ class GitLabProject:
     namespace_id: int
     namespace_path: str
     description: Optional[str] = None
+    last_activity_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncResult:
     """Résultat de synchronisation d'un projet."""
 
@@ -54,7 +56,7 @@ class SyncResult:
     error_message: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SyncSummary:
     """Résumé de la synchronisation."""
 
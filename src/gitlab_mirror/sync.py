@@ -1,30 +1,102 @@
 """Logique de synchronisation GitLab → filesystem."""
 
-import fnmatch
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import os
+import re
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional, Sized
 
-from .config import Config
+from .config import Config, compile_patterns, matched_pattern
 from .git_operations import GitOperations
 from .gitlab_api import GitLabClient
 from .logger import logger
 from .models import GitLabProject, ProjectStatus, SyncResult, SyncSummary
 
+# Icône de chaque statut dans le log de progression
+_STATUS_ICONS = {
+    ProjectStatus.CLONED: "✓",
+    ProjectStatus.UPDATED: "↑",
+    ProjectStatus.ALREADY_UP_TO_DATE: "=",
+    ProjectStatus.IGNORED: "⊘",
+    ProjectStatus.ERROR: "✗",
+}
+
+# Caractères spéciaux fnmatch : un pattern sans aucun d'eux est un nom exact
+_GLOB_CHARS = frozenset("*?[")
+
+# Globs d'inclusion qui correspondent à tout chemin de projet (groupe/projet)
+_MATCH_ALL_GLOBS = frozenset({"*", "**", "**/*", "*/*"})
+
+
+class _ProjectFilters(NamedTuple):
+    """Filtres de projets dérivés des patterns de la configuration."""
+
+    active: bool
+    include_regex: Optional[re.Pattern[str]]
+    exclude_exact: frozenset[str]
+    exclude_globs: tuple[str, ...]
+    exclude_regex: Optional[re.Pattern[str]]
+
+
+@lru_cache(maxsize=8)
+def _build_filters(
+    exclude_patterns: tuple[str, ...], include_patterns: tuple[str, ...]
+) -> _ProjectFilters:
+    """Prépare les filtres d'un jeu de patterns, une fois par jeu distinct.
+
+    Args:
+        exclude_patterns: Patterns d'exclusion de la configuration
+        include_patterns: Patterns d'inclusion de la configuration
+
+    Returns:
+        Filtres prêts à l'emploi (noms exacts normalisés par os.path.normcase)
+    """
+    # Un include "tout" (ex: "*") conserve chaque projet : inutile de l'évaluer
+    include_all = not _MATCH_ALL_GLOBS.isdisjoint(include_patterns)
+    # Excludes littéraux (groupe/projet exact) : test d'appartenance à un
+    # ensemble, la regex combinée ne porte que sur les vrais globs
+    exclude_globs = tuple(p for p in exclude_patterns if _GLOB_CHARS.intersection(p))
+    exclude_exact = frozenset(
+        os.path.normcase(p) for p in exclude_patterns if not _GLOB_CHARS.intersection(p)
+    )
+    return _ProjectFilters(
+        # Cas le plus courant : aucun filtre, chaque projet est conservé
+        active=bool(exclude_patterns) or bool(include_patterns and not include_all),
+        include_regex=None if include_all else compile_patterns(include_patterns),
+        exclude_exact=exclude_exact,
+        exclude_globs=exclude_globs,
+        exclude_regex=compile_patterns(exclude_globs),
+    )
+
 
 class ProjectSynchronizer:
     """Gère la synchronisation des projets GitLab vers le filesystem."""
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, gitlab_client: Optional[GitLabClient] = None) -> None:
         """Initialise le synchroniseur.
 
         Args:
             config: Configuration de l'application
+            gitlab_client: Client GitLab déjà connecté (défaut: nouveau GitLabClient)
         """
         self.config = config
-        self.gitlab_client = GitLabClient(config)
+        self.gitlab_client = gitlab_client if gitlab_client is not None else GitLabClient(config)
         self.git_ops = GitOperations(config)
 
+    def _filters(self) -> _ProjectFilters:
+        """Filtres des patterns actuels de la configuration.
+
+        Relus à chaque appel : une modification de config.exclude_patterns
+        après la construction est prise en compte. La préparation est
+        mémorisée par jeu de patterns.
+        """
+        return _build_filters(
+            tuple(self.config.exclude_patterns), tuple(self.config.include_patterns)
+        )
+
     def get_local_path(self, project: GitLabProject) -> Path:
         """Calcule le chemin local pour un projet.
 
@@ -45,24 +117,7 @@ class ProjectSynchronizer:
         Returns:
             True si le projet doit être exclu
         """
-        path = project.path_with_namespace
-
-        # Si include_patterns défini, le projet doit matcher un pattern
-        if self.config.include_patterns:
-            for pattern in self.config.include_patterns:
-                if fnmatch.fnmatch(path, pattern):
-                    break
-            else:
-                # Ne matche aucun include pattern → exclu
-                return True
-
-        # Vérifier les exclude patterns
-        if self.config.exclude_patterns:
-            for pattern in self.config.exclude_patterns:
-                if fnmatch.fnmatch(path, pattern):
-                    return True
-
-        return False
+        return self._exclusion_reason(project) is not None
 
     def _find_matching_pattern(self, project: GitLabProject) -> str:
         """Trouve le pattern qui a exclu un projet.
@@ -73,23 +128,38 @@ class ProjectSynchronizer:
         Returns:
             Le pattern qui correspond, ou "unknown"
         """
-        path = project.path_with_namespace
-
-        # Vérifier include patterns d'abord
-        if self.config.include_patterns:
-            matches_include = False
-            for pattern in self.config.include_patterns:
-                if fnmatch.fnmatch(path, pattern):
-                    matches_include = True
-                    break
-            if not matches_include:
-                return f"non inclus (patterns: {', '.join(self.config.include_patterns)})"
-
-        # Puis exclude patterns
-        for pattern in self.config.exclude_patterns:
-            if fnmatch.fnmatch(path, pattern):
-                return pattern
-        return "unknown"
+        return self._exclusion_reason(project) or "unknown"
+
+    def _exclusion_reason(self, project: GitLabProject) -> Optional[str]:
+        """Évalue les filtres une seule fois : décision d'exclusion et motif.
+
+        Args:
+            project: Projet GitLab
+
+        Returns:
+            Le pattern (ou la raison) qui exclut le projet, None s'il est conservé
+        """
+        filters = self._filters()
+        if not filters.active:
+            return None
+
+        # Normalisé comme les patterns (insensible à la casse sous Windows,
+        # comme fnmatch.fnmatch)
+        path = os.path.normcase(project.path_with_namespace)
+
+        # Si include_patterns défini, le projet doit matcher un pattern
+        # (regex combinée précompilée)
+        if filters.include_regex is not None and not filters.include_regex.match(path):
+            return f"non inclus (patterns: {', '.join(self.config.include_patterns)})"
+
+        # Vérifier les exclude patterns : nom exact d'abord, puis globs (le
+        # groupe nommé de la correspondance désigne le pattern responsable)
+        if path in filters.exclude_exact:
+            return project.path_with_namespace
+        match = filters.exclude_regex.match(path) if filters.exclude_regex is not None else None
+        if match is None:
+            return None
+        return matched_pattern(match, filters.exclude_globs)
 
     def determine_project_action(
         self, project: GitLabProject, local_path: Path
@@ -103,12 +173,14 @@ class ProjectSynchronizer:
         Returns:
             Statut indiquant l'action à effectuer
         """
-        # Cas 1: Le chemin n'existe pas → à cloner
-        if not local_path.exists():
-            return ProjectStatus.TO_CLONE
-
-        # Cas 2: Le chemin existe mais n'est pas un dépôt Git
+        # Dépôt testé en premier : sur une synchronisation incrémentale, le
+        # stat de .git suffit (le dossier existe forcément)
         if not self.git_ops.is_git_repository(local_path):
+            # Cas 1: Le chemin n'existe pas → à cloner
+            if not os.path.exists(local_path):
+                return ProjectStatus.TO_CLONE
+
+            # Cas 2: Le chemin existe mais n'est pas un dépôt Git
             logger.warning(
                 f"{project.path_with_namespace}: "
                 f"Le dossier existe mais n'est pas un dépôt Git"
@@ -135,17 +207,36 @@ class ProjectSynchronizer:
         # Cas 4: Dépôt valide correspondant au projet
         return ProjectStatus.ALREADY_UP_TO_DATE
 
-    def sync_project(self, project: GitLabProject) -> SyncResult:
+    def sync_project(
+        self, project: GitLabProject, local_path: Optional[Path] = None
+    ) -> SyncResult:
         """Synchronise un projet GitLab.
 
         Args:
             project: Projet à synchroniser
+            local_path: Chemin local déjà calculé (défaut: get_local_path)
 
         Returns:
             Résultat de la synchronisation
         """
-        local_path = self.get_local_path(project)
+        if local_path is None:
+            local_path = self.get_local_path(project)
+        try:
+            return self._sync_project_at(project, local_path)
+        finally:
+            # Le dépôt a pu être ouvert à plusieurs étapes : le libérer une fois traité
+            self.git_ops.release_repo(local_path)
+
+    def _sync_project_at(self, project: GitLabProject, local_path: Path) -> SyncResult:
+        """Synchronise un projet GitLab vers son chemin local (voir sync_project).
+
+        Args:
+            project: Projet à synchroniser
+            local_path: Chemin local du projet
 
+        Returns:
+            Résultat de la synchronisation
+        """
         # Déterminer l'action à effectuer
         action = self.determine_project_action(project, local_path)
 
@@ -215,64 +306,40 @@ class ProjectSynchronizer:
         if not self.config.dry_run:
             self.config.create_root_dir()
 
-        # === PHASE 1: DÉCOUVERTE RAPIDE ===
+        # === DÉCOUVERTE ET SYNCHRONISATION EN FLUX ===
+        # Les projets sont synchronisés dès que la pagination GitLab les
+        # produit : la latence de découverte est masquée par celle des clones
+        workers = self.config.max_workers
         logger.info("=" * 70)
-        logger.info("DÉCOUVERTE DES PROJETS GITLAB")
+        logger.info(f"DÉCOUVERTE ET SYNCHRONISATION DES PROJETS ({workers} threads)")
         logger.info("=" * 70)
 
         if progress_callback:
             progress_callback("Découverte des projets...")
 
-        projects = self.gitlab_client.discover_all_projects(group_identifiers)
-
-        # Filtrer les projets exclus et créer des résultats pour eux
+        # Filtrer les projets exclus au fil de l'eau et créer des résultats pour eux
         excluded_results: list[SyncResult] = []
-        if self.config.exclude_patterns or self.config.include_patterns:
-            included_projects = []
-            for project in projects:
-                if self.is_project_excluded(project):
-                    # Trouver quel pattern a exclu ce projet
-                    matched_pattern = self._find_matching_pattern(project)
-                    excluded_results.append(
-                        SyncResult(
-                            project=project,
-                            status=ProjectStatus.EXCLUDED,
-                            local_path="",
-                            error_message=f"Exclu: {matched_pattern}",
-                        )
-                    )
-                else:
-                    included_projects.append(project)
-            projects = included_projects
-            if excluded_results:
-                logger.info(f"⊖ {len(excluded_results)} projet(s) exclus par filtres")
-
-        logger.info("=" * 70)
-        logger.info(f"TOTAL: {len(projects)} projet(s) à synchroniser")
-        logger.info("=" * 70)
+        projects = self._filter_projects(
+            self.gitlab_client.iter_all_projects(group_identifiers), excluded_results
+        )
 
-        if not projects:
+        try:
+            results = self._sync_projects_parallel(projects, progress_callback)
+        finally:
+            # Même après une exception ou un Ctrl-C : sondes ls-remote déjà
+            # faites conservées, clones partiels supprimés (sinon repris par
+            # _sweep_failed_clones à la synchronisation suivante)
+            self.git_ops.ls_remote_cache.save()
+            self.git_ops.wait_for_cleanup()
+
+        if excluded_results:
+            logger.info(f"⊖ {len(excluded_results)} projet(s) exclus par filtres")
+        if not results:
             logger.warning("Aucun projet trouvé, rien à synchroniser")
-            return SyncSummary(
-                total_groups=len(group_identifiers),
-                total_projects=len(excluded_results),
-                cloned=0,
-                updated=0,
-                already_up_to_date=0,
-                ignored=0,
-                excluded=len(excluded_results),
-                errors=0,
-                results=excluded_results,
-            )
-
-        # === PHASE 2: SYNCHRONISATION PARALLÈLE ===
-        workers = self.config.max_workers
-        logger.info("")
-        logger.info("=" * 70)
-        logger.info(f"SYNCHRONISATION DES PROJETS ({workers} threads)")
-        logger.info("=" * 70)
-
-        results = self._sync_projects_parallel(projects, progress_callback)
+        else:
+            logger.info("=" * 70)
+            logger.info(f"TOTAL: {len(results)} projet(s) synchronisé(s)")
+            logger.info("=" * 70)
 
         # Ajouter les projets exclus aux résultats
         all_results = excluded_results + results
@@ -280,15 +347,45 @@ class ProjectSynchronizer:
         # Calculer le résumé
         return self._build_summary(group_identifiers, all_results)
 
+    def _filter_projects(
+        self, projects: Iterable[GitLabProject], excluded_results: list[SyncResult]
+    ) -> Iterator[GitLabProject]:
+        """Produit les projets conservés par les filtres, au fil de la découverte.
+
+        Args:
+            projects: Projets découverts
+            excluded_results: Liste complétée avec un résultat EXCLUDED par projet exclu
+
+        Yields:
+            Projets à synchroniser
+        """
+        for project in projects:
+            # Décision et pattern responsable obtenus en une seule évaluation
+            reason = self._exclusion_reason(project)
+            if reason is None:
+                yield project
+            else:
+                excluded_results.append(
+                    SyncResult(
+                        project=project,
+                        status=ProjectStatus.EXCLUDED,
+                        local_path="",
+                        error_message=f"Exclu: {reason}",
+                    )
+                )
+
     def _sync_projects_parallel(
         self,
-        projects: list[GitLabProject],
+        projects: Iterable[GitLabProject],
         progress_callback: Optional[Callable[[str], None]] = None,
     ) -> list[SyncResult]:
         """Synchronise les projets en parallèle.
 
+        Les projets peuvent arriver en flux (découverte en cours) : tant que
+        leur nombre n'est pas connu, la progression affiche "?" comme total.
+
         Args:
-            projects: Liste des projets à synchroniser
+            projects: Projets à synchroniser (liste ou itérable en flux)
             progress_callback: Callback de progression
 
         Returns:
@@ -296,56 +393,90 @@ class ProjectSynchronizer:
         """
         results: list[SyncResult] = []
         completed = 0
-        total = len(projects)
+        submitted = 0
+        total: Optional[int] = len(projects) if isinstance(projects, Sized) else None
         workers = self.config.max_workers
+        # Tâches en vol bornées : au plus 2 projets en attente par thread
+        # (mémoire O(workers) au lieu de N futures soumises d'un coup)
+        max_pending = 2 * workers
+        # Chemin local calculé une seule fois par projet, partagé avec le worker
+        pending_projects = ((project, self.get_local_path(project)) for project in projects)
 
         with ThreadPoolExecutor(max_workers=workers) as executor:
-            # Soumettre tous les projets
-            future_to_project = {
-                executor.submit(self.sync_project, project): project
-                for project in projects
-            }
-
-            # Collecter les résultats au fur et à mesure
-            for future in as_completed(future_to_project):
-                project = future_to_project[future]
-                completed += 1
-
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    # Log le résultat
-                    status_icon = {
-                        ProjectStatus.CLONED: "✓",
-                        ProjectStatus.UPDATED: "↑",
-                        ProjectStatus.ALREADY_UP_TO_DATE: "=",
-                        ProjectStatus.IGNORED: "⊘",
-                        ProjectStatus.ERROR: "✗",
-                    }.get(result.status, "?")
-
-                    logger.info(
-                        f"{status_icon} [{completed}/{total}] {project.path_with_namespace}"
-                    )
-
-                    if progress_callback:
-                        progress_callback(
-                            f"[{completed}/{total}] {project.path_with_namespace}"
-                        )
-
-                except Exception as e:
-                    logger.error(f"✗ [{completed}/{total}] {project.path_with_namespace}: {e}")
+            future_to_project: dict[Future[SyncResult], tuple[GitLabProject, Path]] = {}
+
+            def submit_next() -> None:
+                nonlocal submitted, total
+                free = max_pending - len(future_to_project)
+                for item in itertools.islice(pending_projects, free):
+                    future_to_project[executor.submit(self.sync_project, *item)] = item
+                    submitted += 1
+                    free -= 1
+                if free > 0:
+                    # Source épuisée : le nombre total est désormais connu
+                    total = submitted
+
+            submit_next()
+
+            # Collecter les résultats au fur et à mesure, en réalimentant la file
+            while future_to_project:
+                done, _ = wait(future_to_project, return_when=FIRST_COMPLETED)
+                for future in done:
+                    project, local_path = future_to_project.pop(future)
+                    completed += 1
                     results.append(
-                        SyncResult(
-                            project=project,
-                            status=ProjectStatus.ERROR,
-                            local_path=str(self.get_local_path(project)),
-                            error_message=str(e),
+                        self._collect_result(
+                            future, project, local_path, completed, total, progress_callback
                         )
                     )
+                submit_next()
 
         return results
 
+    def _collect_result(
+        self,
+        future: Future[SyncResult],
+        project: GitLabProject,
+        local_path: Path,
+        completed: int,
+        total: Optional[int],
+        progress_callback: Optional[Callable[[str], None]] = None,
+    ) -> SyncResult:
+        """Récupère et journalise le résultat d'un projet terminé.
+
+        Args:
+            future: Tâche terminée de sync_project
+            project: Projet correspondant
+            local_path: Chemin local du projet
+            completed: Nombre de projets terminés (celui-ci compris)
+            total: Nombre total de projets (None si encore inconnu)
+            progress_callback: Callback de progression
+
+        Returns:
+            Résultat de la synchronisation (ERROR si la tâche a levé une exception)
+        """
+        counter = f"[{completed}/{total if total is not None else '?'}]"
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error(f"✗ {counter} {project.path_with_namespace}: {e}")
+            return SyncResult(
+                project=project,
+                status=ProjectStatus.ERROR,
+                local_path=str(local_path),
+                error_message=str(e),
+            )
+
+        # Log le résultat
+        status_icon = _STATUS_ICONS.get(result.status, "?")
+
+        logger.info(f"{status_icon} {counter} {project.path_with_namespace}")
+
+        if progress_callback:
+            progress_callback(f"{counter} {project.path_with_namespace}")
+
+        return result
+
     def _build_summary(
         self, group_identifiers: list[str], results: list[SyncResult]
     ) -> SyncSummary:
@@ -358,23 +489,17 @@ class ProjectSynchronizer:
         Returns:
             Résumé de la synchronisation
         """
-        cloned = sum(1 for r in results if r.status == ProjectStatus.CLONED)
-        updated = sum(1 for r in results if r.status == ProjectStatus.UPDATED)
-        already_up_to_date = sum(
-            1 for r in results if r.status == ProjectStatus.ALREADY_UP_TO_DATE
-        )
-        ignored = sum(1 for r in results if r.status == ProjectStatus.IGNORED)
-        excluded = sum(1 for r in results if r.status == ProjectStatus.EXCLUDED)
-        errors = sum(1 for r in results if r.status == ProjectStatus.ERROR)
+        # Un seul parcours des résultats pour tous les statuts
+        counts = Counter(r.status for r in results)
 
         return SyncSummary(
             total_groups=len(group_identifiers),
             total_projects=len(results),
-            cloned=cloned,
-            updated=updated,
-            already_up_to_date=already_up_to_date,
-            ignored=ignored,
-            excluded=excluded,
-            errors=errors,
+            cloned=counts[ProjectStatus.CLONED],
+            updated=counts[ProjectStatus.UPDATED],
+            already_up_to_date=counts[ProjectStatus.ALREADY_UP_TO_DATE],
+            ignored=counts[ProjectStatus.IGNORED],
+            excluded=counts[ProjectStatus.EXCLUDED],
+            errors=counts[ProjectStatus.ERROR],
             results=results,
         )
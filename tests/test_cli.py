@@ -0,0 +1,64 @@
+"""Tests pour le module cli."""
+
+from pathlib import Path
+
+import git
+import pytest
+from rich.console import Console
+
+from gitlab_mirror import cli as cli_module
+from gitlab_mirror.cli import (
+    BULK_TABLE_THRESHOLD,
+    _detail_table,
+    _inspect_local_repo,
+    orjson,
+    print_json,
+)
+
+
+def test_inspect_local_repo_bare(tmp_path: Path) -> None:
+    """Test l'inspection d'un clone bare par la commande status."""
+    actor = git.Actor("Test", "test@example.com")
+    work = git.Repo.init(tmp_path / "work", initial_branch="main")
+    work.index.commit("initial", author=actor, committer=actor)
+
+    root = tmp_path / "gitlab-repos"
+    git.Repo.clone_from(work.working_dir, root / "group" / "project", bare=True)
+
+    rel_path, info = _inspect_local_repo(root, root / "group" / "project", timeout=30)
+
+    assert rel_path == "group/project"
+    assert info.error is False
+    assert info.branch == "main"
+    assert info.dirty is False
+
+
+def test_detail_table_bulk_is_aligned() -> None:
+    """Test l'alignement des colonnes du rendu texte des gros tableaux."""
+    rows = [(f"group/{'p' * (i % 7 + 1)}", "raison") for i in range(BULK_TABLE_THRESHOLD + 1)]
+    console = Console(width=200, record=True)
+    console.print(_detail_table("Ignorés", (("Projet", "cyan"), ("Raison", "dim")), rows))
+
+    title, header, *lines = console.export_text().splitlines()
+    assert title == "Ignorés"
+    # Deuxième colonne à la même position sur chaque ligne, en-tête compris
+    column = header.index("Raison")
+    assert column == len("group/ppppppp  ")
+    assert all(line.index("raison") == column for line in lines)
+
+
+def test_print_json_fallback_matches_orjson(
+    capsysbinary: pytest.CaptureFixture[bytes], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test que le repli json écrit le même document UTF-8 qu'orjson."""
+    output = {"projets": [{"path": "équipe/dépôt", "error": "Échec du clonage"}]}
+
+    monkeypatch.setattr(cli_module, "orjson", None)
+    print_json(output)
+    fallback = capsysbinary.readouterr().out
+
+    assert "équipe/dépôt".encode() in fallback
+    if orjson is not None:
+        monkeypatch.setattr(cli_module, "orjson", orjson)
+        print_json(output)
+        assert capsysbinary.readouterr().out == fallback
@@ -4,7 +4,17 @@ from pathlib import Path
 
 import pytest
 
-from gitlab_mirror.config import Config, load_config
+from gitlab_mirror import config as config_module
+from gitlab_mirror.config import (
+    Config,
+    _first_existing,
+    _load_config_cached,
+    _toml_values,
+    clear_config_cache,
+    compile_patterns,
+    load_config,
+    matched_pattern,
+)
 
 
 def test_config_default_values() -> None:
@@ -66,3 +76,174 @@ def test_config_create_root_dir(tmp_path: Path) -> None:
     config.create_root_dir()
     assert root.exists()
     assert root.is_dir()
+
+
+def test_compile_patterns() -> None:
+    """Test la compilation des patterns fnmatch en une seule regex."""
+    patterns = ["*/test-*", "*/old-*"]
+    regex = compile_patterns(tuple(patterns))
+
+    assert regex is not None
+    assert regex.match("group/test-app")
+    assert not regex.match("group/app")
+    match = regex.match("group/old-app")
+    assert match is not None
+    assert matched_pattern(match, patterns) == "*/old-*"
+    assert compile_patterns(()) is None
+
+
+def test_load_config_is_cached(tmp_path: Path) -> None:
+    """Test que load_config mémorise le résultat et retourne des copies."""
+    clear_config_cache()
+    first = load_config(token="test", root_dir=tmp_path, exclude_patterns=["*/old-*"])
+    first.exclude_patterns.append("*/tmp-*")
+    first.dry_run = True
+
+    second = load_config(token="test", root_dir=tmp_path, exclude_patterns=["*/old-*"])
+
+    assert second is not first
+    assert second.exclude_patterns == ["*/old-*"]
+    assert second.dry_run is False
+    assert _load_config_cached.cache_info().hits == 1
+
+
+def test_load_config_cache_follows_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test que la config mémorisée suit l'environnement et le fichier TOML."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("GITLAB_URL", raising=False)
+    config_file = tmp_path / ".lgm.toml"
+    config_file.write_text('root_dir = "first"\n')
+    clear_config_cache()
+
+    assert load_config(token="test").root_dir.name == "first"
+
+    monkeypatch.setenv("GITLAB_URL", "https://gitlab.example.com")
+    assert load_config(token="test").gitlab_url == "https://gitlab.example.com"
+
+    config_file.write_text('root_dir = "second-dir"\n')
+    assert load_config(token="test").root_dir.name == "second-dir"
+    clear_config_cache()
+
+
+def test_first_existing_respects_priority(tmp_path: Path) -> None:
+    """Test que la recherche de fichier respecte l'ordre de priorité."""
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "b.toml").touch()
+    (tmp_path / "sub" / "a.toml").touch()
+    locations = (
+        tmp_path / "missing" / "x.toml",
+        tmp_path / "a.toml",
+        tmp_path / "sub" / "a.toml",
+        tmp_path / "b.toml",
+    )
+
+    assert _first_existing(locations) == tmp_path / "sub" / "a.toml"
+    assert _first_existing(locations[:2]) is None
+
+
+def test_toml_values_sections_override_root_keys() -> None:
+    """Test que les sections TOML ont priorité sur les anciennes clés racine."""
+    values = _toml_values(
+        {
+            "gitlab_url": "https://old.example.com",
+            "url": "https://gitlab.example.com",
+            "max_workers": 2,
+            "performance": {"max_workers": 8},
+            "clone_depth": 1,
+            "filters": {"exclude": "*/test-*"},
+            "smart_update": False,
+        }
+    )
+    config = Config(token="test", **values)
+
+    assert config.gitlab_url == "https://gitlab.example.com"
+    assert config.max_workers == 8
+    assert config.clone_depth == 1
+    assert config.exclude_patterns == ["*/test-*"]
+    assert config.smart_update is False
+
+
+def test_load_toml_config_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test que le TOML est relu seulement si le fichier change."""
+    toml_file = tmp_path / "config.toml"
+    toml_file.write_text("[performance]\nmax_workers = 8\n")
+    monkeypatch.setattr(config_module, "find_config_file", lambda: toml_file)
+
+    first = config_module.load_toml_config()
+    assert first == {"performance": {"max_workers": 8}}
+    assert config_module.load_toml_config() is first
+
+    toml_file.write_text("[performance]\nmax_workers = 16\n")
+    assert config_module.load_toml_config() == {"performance": {"max_workers": 16}}
+
+
+def test_find_config_file_follows_cwd(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test que la recherche suit le répertoire courant."""
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / ".lgm.toml").touch()
+
+    monkeypatch.chdir(project)
+    assert config_module.find_config_file() == project / ".lgm.toml"
+
+    monkeypatch.chdir(tmp_path)
+    assert config_module.find_config_file() != project / ".lgm.toml"
+
+
+def test_load_env_file_manually(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test la lecture du fichier .env pour debug."""
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# Configuration\n"
+        "GITLAB_URL=https://gitlab.example.com\n"
+        "  GITLAB_TOKEN = glpat-abc=def  \n"
+        "\n"
+        "LIGNE INVALIDE\n"
+    )
+    monkeypatch.setattr(config_module, "find_env_file", lambda: str(env_file))
+
+    assert config_module._load_env_file_manually() == {
+        "GITLAB_URL": "https://gitlab.example.com",
+        "GITLAB_TOKEN": "glpat-abc=def",
+    }
+
+
+def test_config_clone_options() -> None:
+    """Test les options de clonage dérivées de la configuration."""
+    assert Config(token="test", single_branch=False, filter_blobs=False).clone_options == {}
+
+    config = Config(token="test", clone_depth=1, single_branch=True, filter_blobs=True)
+    assert config.clone_options == {"depth": 1, "single_branch": True, "filter": "blob:none"}
+
+
+def test_config_partial_clone_filter() -> None:
+    """Test le filtre de partial clone et l'option sans checkout."""
+    config = Config(filter_blobs=True, partial_clone_filter="tree:0", no_checkout=True)
+    assert config.clone_options == {"filter": "tree:0", "no_checkout": True}
+
+    # Dépôt bare : pas de copie de travail, no_checkout sans objet
+    config = Config(partial_clone_filter="blob:limit=1m", no_checkout=True, bare_clone=True)
+    assert config.clone_options == {"filter": "blob:limit=1m", "bare": True}
+
+    with pytest.raises(ValueError):
+        Config(partial_clone_filter="sparse:oid=HEAD")
+
+
+def test_config_default_max_workers(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test le nombre de threads par défaut (4 par CPU, borné à 32)."""
+    monkeypatch.setattr(config_module.os, "cpu_count", lambda: 2)
+    assert Config(token="test-token").max_workers == 8
+
+    monkeypatch.setattr(config_module.os, "cpu_count", lambda: 64)
+    assert Config(token="test-token").max_workers == 32
+
+    # Une valeur explicite est conservée
+    assert Config(token="test-token", max_workers=3).max_workers == 3
+
+
+def test_config_discovery_thread_count() -> None:
+    """Test le nombre de threads de découverte (repli sur max_workers)."""
+    assert Config(token="test-token", max_workers=6).discovery_thread_count == 6
+    config = Config(token="test-token", max_workers=6, discovery_workers=20)
+    assert config.discovery_thread_count == 20
+    assert _toml_values({"performance": {"discovery_workers": 12}}) == {"discovery_workers": 12}
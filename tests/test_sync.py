@@ -1,13 +1,14 @@
 """Tests pour le module sync."""
 
+import os
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from gitlab_mirror.config import Config
+from gitlab_mirror.config import Config, compile_patterns
 from gitlab_mirror.models import GitLabProject, ProjectStatus
-from gitlab_mirror.sync import ProjectSynchronizer
+from gitlab_mirror.sync import ProjectSynchronizer, _build_filters
 
 
 def test_get_local_path(
@@ -223,3 +224,177 @@ def test_sync_project_ignored(
     result = sync.sync_project(sample_project)
     
     assert result.status == ProjectStatus.IGNORED
+
+
+def test_sync_projects_parallel_bounded(
+    test_config: Config, sample_project: GitLabProject, mocker: Any
+) -> None:
+    """Test la synchronisation parallèle par lots bornés (tous traités, erreurs comprises)."""
+    import dataclasses
+    import threading
+
+    from gitlab_mirror.models import SyncResult
+
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+    test_config.max_workers = 2
+    sync = ProjectSynchronizer(test_config)
+    projects = [dataclasses.replace(sample_project, id=i) for i in range(20)]
+
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def fake_sync(project: GitLabProject, local_path: Path) -> SyncResult:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        try:
+            if project.id == 3:
+                raise RuntimeError("boom")
+            return SyncResult(
+                project=project, status=ProjectStatus.CLONED, local_path=str(local_path)
+            )
+        finally:
+            with lock:
+                in_flight -= 1
+
+    mocker.patch.object(sync, "sync_project", side_effect=fake_sync)
+
+    results = sync._sync_projects_parallel(projects)
+
+    assert sorted(r.project.id for r in results) == list(range(20))
+    assert [r.status for r in results].count(ProjectStatus.ERROR) == 1
+    assert peak <= 2
+    assert all(r.local_path == str(sync.get_local_path(r.project)) for r in results)
+
+
+def test_sync_groups_streams_discovery(
+    test_config: Config, sample_project: GitLabProject, mocker: Any
+) -> None:
+    """Test la synchronisation des projets au fil de la découverte (filtres compris)."""
+    import dataclasses
+
+    from gitlab_mirror.models import SyncResult
+
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+    test_config.exclude_patterns = ["*/skip-*"]
+    sync = ProjectSynchronizer(test_config)
+    mocker.patch.object(sync.git_ops, "check_git_available", return_value=True)
+
+    def discovered() -> Any:
+        yield sample_project
+        yield dataclasses.replace(
+            sample_project, id=2, path_with_namespace="test-group/skip-me"
+        )
+
+    sync.gitlab_client.iter_all_projects.return_value = discovered()
+    mocker.patch.object(
+        sync,
+        "sync_project",
+        side_effect=lambda project, local_path: SyncResult(
+            project=project, status=ProjectStatus.CLONED, local_path=str(local_path)
+        ),
+    )
+
+    summary = sync.sync_groups(["test-group"])
+
+    assert summary.total_projects == 2
+    assert summary.cloned == 1
+    assert summary.excluded == 1
+
+
+def test_sync_groups_cleans_up_on_error(test_config: Config, mocker: Any) -> None:
+    """Test la sauvegarde du cache et l'attente des suppressions même en cas d'erreur."""
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+    sync = ProjectSynchronizer(test_config)
+    mocker.patch.object(sync.git_ops, "check_git_available", return_value=True)
+    mocker.patch.object(sync, "_sync_projects_parallel", side_effect=KeyboardInterrupt)
+    save = mocker.patch.object(sync.git_ops.ls_remote_cache, "save")
+    wait = mocker.patch.object(sync.git_ops, "wait_for_cleanup")
+
+    with pytest.raises(KeyboardInterrupt):
+        sync.sync_groups(["test-group"])
+
+    save.assert_called_once()
+    wait.assert_called_once()
+
+
+def test_is_project_excluded_include_all(
+    test_config: Config, sample_project: GitLabProject, mocker: Any
+) -> None:
+    """Test qu'un include "tout" n'évalue pas les patterns d'inclusion."""
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+
+    test_config.exclude_patterns = []
+    test_config.include_patterns = ["*/other-*", "*"]
+    sync = ProjectSynchronizer(test_config)
+
+    assert sync._filters().active is False
+    assert sync.is_project_excluded(sample_project) is False
+
+
+def test_is_project_excluded_with_literal_pattern(
+    test_config: Config, sample_project: GitLabProject, mocker: Any
+) -> None:
+    """Test is_project_excluded avec un nom de projet exact (sans glob)."""
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+
+    test_config.exclude_patterns = ["*/other-*", "test-group/my-project"]
+    test_config.include_patterns = []
+    sync = ProjectSynchronizer(test_config)
+
+    assert sync._filters().exclude_exact == {"test-group/my-project"}
+    assert sync.is_project_excluded(sample_project) is True
+    assert sync._find_matching_pattern(sample_project) == "test-group/my-project"
+
+
+def test_is_project_excluded_follows_config_changes(
+    test_config: Config, sample_project: GitLabProject, mocker: Any
+) -> None:
+    """Test que les filtres suivent les patterns modifiés après la construction."""
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+
+    test_config.exclude_patterns = []
+    test_config.include_patterns = []
+    sync = ProjectSynchronizer(test_config)
+    assert sync.is_project_excluded(sample_project) is False
+
+    test_config.exclude_patterns.append("*/my-*")
+    assert sync.is_project_excluded(sample_project) is True
+    assert sync._find_matching_pattern(sample_project) == "*/my-*"
+
+
+def test_is_project_excluded_uses_normcase(
+    test_config: Config,
+    sample_project: GitLabProject,
+    mocker: Any,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test la normalisation de casse des patterns et chemins (comme fnmatch sous Windows)."""
+    mocker.patch("gitlab_mirror.sync.GitLabClient")
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+    compile_patterns.cache_clear()
+    _build_filters.cache_clear()
+
+    test_config.include_patterns = []
+    sync = ProjectSynchronizer(test_config)
+    try:
+        test_config.exclude_patterns = ["*/MY-*"]
+        assert sync.is_project_excluded(sample_project) is True
+        test_config.exclude_patterns = ["Test-Group/My-Project"]
+        assert sync.is_project_excluded(sample_project) is True
+    finally:
+        compile_patterns.cache_clear()
+        _build_filters.cache_clear()
+
+
+def test_synchronizer_uses_injected_client(test_config: Config, mocker: Any) -> None:
+    """Test l'injection d'un client GitLab (aucune connexion créée)."""
+    client_class = mocker.patch("gitlab_mirror.sync.GitLabClient")
+    client = mocker.MagicMock()
+
+    sync = ProjectSynchronizer(test_config, gitlab_client=client)
+
+    assert sync.gitlab_client is client
+    client_class.assert_not_called()